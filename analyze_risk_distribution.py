@@ -1,150 +1,277 @@
 #!/usr/bin/env python3
 
 import os
+import sys
 import subprocess
-import re
 import json
+import tempfile
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+SEP = "=" * 50
+DASH = "-" * 50
+
+# Risk categorization bins, applied to the whole score array at once
+RISK_THRESHOLDS = np.array([0.30, 0.55, 0.75])
+RISK_LABELS = np.array(["🟢 LOW RISK", "🟡 MEDIUM RISK", "🟠 HIGH RISK", "🔴 CRITICAL RISK"])
+
+# Persistent score cache so threshold-tuning reruns skip unchanged workflows
+CACHE_FILE = '.maestro_cache.json'
+
+def _load_cache():
+    """Load the persisted score cache; missing or corrupt files mean empty"""
+    try:
+        with open(CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _save_cache(cache):
+    """Persist the score cache for the next run"""
+    try:
+        with open(CACHE_FILE, 'w') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+def _cache_key(workflow_file):
+    """Cache key tied to the file path and its last modification time"""
+    return f"{workflow_file}:{os.path.getmtime(workflow_file)}"
+
+# Filename markers mapped to expected risk levels, checked in order
+EXPECTED_RISK_TOKENS = (
+    ("_low_risk_", "low"),
+    ("_medium_risk_", "medium"),
+    ("_high_risk_", "high"),
+    ("_critical_risk_", "critical"),
+)
+
+@functools.lru_cache(maxsize=None)
+def _extract_scores_cached(workflow_file, mtime):
+    """In-process memo of extract_scores keyed on (path, mtime)"""
+    return extract_scores(workflow_file)
 
 def extract_scores(workflow_file):
-    """Extract WEI and RPS scores from maestro output"""
+    """Extract WEI and RPS scores from the maestro JSON report"""
     try:
-        result = subprocess.run(['./maestro', 'analyze-workflow', '-i', workflow_file, '-r', 'json'], 
-                              capture_output=True, text=True)
-        output = result.stdout
-        
-        # Extract WEI score
-        wei_match = re.search(r'WEI Score: ([0-9.]+)', output)
-        wei_score = float(wei_match.group(1)) if wei_match else 0.0
-        
-        # Extract RPS score  
-        rps_match = re.search(r'RPS Score: ([0-9.]+)', output)
-        rps_score = float(rps_match.group(1)) if rps_match else 0.0
-        
-        # Extract actual risk level
-        risk_match = re.search(r'Risk Level: (.+)', output)
-        actual_risk = risk_match.group(1).strip() if risk_match else "UNKNOWN"
-        
-        return wei_score, rps_score, actual_risk
+        # Ask maestro to write its JSON report to a temp file and read the
+        # scores structurally instead of scraping the console output.
+        fd, report_path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        try:
+            # Stream stdout line by line instead of buffering the whole
+            # output; the three console fields double as a fallback if the
+            # JSON report turns out to be missing or malformed.
+            proc = subprocess.Popen(['./maestro', 'analyze-workflow', '-i', workflow_file,
+                                     '-r', 'json', '-o', report_path],
+                                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                    text=True)
+            text_wei, text_rps, text_risk = 0.0, 0.0, "UNKNOWN"
+            found = 0
+            for line in proc.stdout:
+                if found < 3:
+                    # Fixed "label: value" lines; plain string dispatch,
+                    # no regex engine involved
+                    head, sep, val = line.partition(':')
+                    if not sep:
+                        continue
+                    try:
+                        if head.endswith('WEI Score'):
+                            text_wei = float(val.split()[0])
+                        elif head.endswith('RPS Score'):
+                            text_rps = float(val.split()[0])
+                        elif head.endswith('Risk Level'):
+                            text_risk = val.strip()
+                        else:
+                            continue
+                    except (ValueError, IndexError):
+                        continue
+                    found += 1
+            proc.wait()
+
+            try:
+                with open(report_path) as f:
+                    report = json.load(f)
+                wei_score = float(report.get('wei_score', 0.0))
+                rps_score = float(report.get('rps_score', 0.0))
+                actual_risk = str(report.get('risk_level', 'UNKNOWN')).upper()
+            except (OSError, ValueError):
+                wei_score, rps_score, actual_risk = text_wei, text_rps, text_risk
+
+            # Canonical short token ("CRITICAL" out of "🔴 CRITICAL RISK"),
+            # computed once here so the accuracy loop is a plain membership test
+            parts = actual_risk.split()
+            actual_short = parts[-2] if len(parts) > 1 else actual_risk
+            return wei_score, rps_score, actual_risk, actual_short
+        finally:
+            if os.path.exists(report_path):
+                os.unlink(report_path)
     except Exception as e:
         print(f"Error analyzing {workflow_file}: {e}")
-        return 0.0, 0.0, "ERROR"
+        return 0.0, 0.0, "ERROR", "ERROR"
+
+def extract_scores_batch(workflow_files):
+    """Analyze all workflows with one maestro invocation instead of one per file
+
+    Returns a list of (wei, rps, actual_risk, actual_short) tuples in input
+    order, or None if the batch run failed (callers fall back to per-file runs).
+    """
+    fd, report_path = tempfile.mkstemp(suffix='.json')
+    os.close(fd)
+    try:
+        cmd = ['./maestro', 'analyze-workflow', '-r', 'json', '-o', report_path]
+        for path in workflow_files:
+            cmd.extend(['-i', path])
+        subprocess.run(cmd, capture_output=True, text=True)
+
+        with open(report_path) as f:
+            reports = json.load(f)
+        by_file = {entry.get('input_file'): entry for entry in reports}
+
+        results = []
+        for path in workflow_files:
+            entry = by_file[path]
+            wei_score = float(entry.get('wei_score', 0.0))
+            rps_score = float(entry.get('rps_score', 0.0))
+            actual_risk = str(entry.get('risk_level', 'UNKNOWN')).upper()
+            parts = actual_risk.split()
+            actual_short = parts[-2] if len(parts) > 1 else actual_risk
+            results.append((wei_score, rps_score, actual_risk, actual_short))
+        return results
+    except Exception:
+        return None
+    finally:
+        if os.path.exists(report_path):
+            os.unlink(report_path)
 
 def calculate_combined_risk(wei_score, rps_score):
-    """Calculate combined risk using current formula"""
-    return (wei_score * 0.7) + (rps_score / 30.0 * 0.3)
-
-def categorize_risk(combined_score):
-    """Categorize risk based on current thresholds"""
-    if combined_score >= 0.75:
-        return "🔴 CRITICAL RISK"
-    elif combined_score >= 0.55:
-        return "🟠 HIGH RISK"
-    elif combined_score >= 0.30:
-        return "🟡 MEDIUM RISK"
-    else:
-        return "🟢 LOW RISK"
+    """Calculate combined risk using current formula (scalar or array)"""
+    return (wei_score * 0.7) + (rps_score * (0.3 / 30.0))
+
+@functools.lru_cache(maxsize=None)
+def compute_risk_metrics(tasks):
+    """Run the expensive per-workflow assessments for a tuple of tasks
+
+    Memoized on the task tuple so repeated reporting passes (e.g. trying
+    different thresholds) pay the subprocess cost only once per process,
+    with the disk cache covering runs in later processes.
+    """
+    # Skip workflows whose scores are already cached from a previous run
+    cache = _load_cache()
+    keys = [_cache_key(t[1]) for t in tasks]
+    pending = [t[1] for t, key in zip(tasks, keys) if key not in cache]
+
+    if pending:
+        # Prefer a single batched maestro run (one process fork instead of 16);
+        # fall back to per-file subprocesses in a thread pool if that fails.
+        fresh_results = extract_scores_batch(pending)
+        if fresh_results is None:
+            with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+                fresh_results = list(executor.map(
+                    lambda p: _extract_scores_cached(p, os.path.getmtime(p)), pending))
+        for path, result in zip(pending, fresh_results):
+            cache[_cache_key(path)] = list(result)
+        _save_cache(cache)
+
+    score_results = [tuple(cache[key]) for key in keys]
+
+    # Structure-of-arrays layout: numeric fields live in parallel numpy
+    # arrays, strings stay in plain lists.
+    n = len(tasks)
+    ids = np.fromiter((t[0] for t in tasks), dtype=np.int32, count=n)
+    expected = np.array([t[2] for t in tasks])
+    wei_scores = np.fromiter((r[0] for r in score_results), dtype=np.float64, count=n)
+    rps_scores = np.fromiter((r[1] for r in score_results), dtype=np.float64, count=n)
+    actual_risks = [r[2] for r in score_results]
+    actual_shorts = [r[3] for r in score_results]
+
+    return ids, expected, wei_scores, rps_scores, actual_risks, actual_shorts
+
+def rebalance(wei_scores, rps_scores, thresholds=RISK_THRESHOLDS):
+    """Re-bin already-computed scores against a threshold vector (cheap)
+
+    Only this step depends on the thresholds, so tuning them re-runs a pair
+    of vectorized passes instead of the assessments themselves.
+    """
+    combined_scores = calculate_combined_risk(wei_scores, rps_scores)
+    # Categorize every workflow at once instead of per-element calls;
+    # side='right' keeps scores equal to a threshold in the higher bin
+    predicted_risks = RISK_LABELS[np.searchsorted(thresholds, combined_scores, side='right')]
+    return combined_scores, predicted_risks
 
 def main():
-    print("Risk Distribution Analysis")
-    print("=" * 50)
-    
-    workflows = []
-    
-    # Analyze all workflows
+    # Buffer all report lines and emit them with a single write at the end
+    lines = ["Risk Distribution Analysis", SEP]
+
+    # List the examples directory once and index files by their numeric prefix
+    files_by_id = {}
+    for name in sorted(os.listdir('examples')):
+        prefix = name[:2]
+        if prefix.isdigit() and name[2:3] == '_':
+            files_by_id.setdefault(int(prefix), name)
+
+    # Collect the workflows to analyze up front
+    tasks = []
     for i in range(1, 17):
-        workflow_files = [f for f in os.listdir('examples') if f.startswith(f'{i:02d}_')]
-        if workflow_files:
-            workflow_file = f'examples/{workflow_files[0]}'
-            
+        if i in files_by_id:
+            workflow_file = f'examples/{files_by_id[i]}'
+
             # Extract expected risk from filename
-            expected_risk = "unknown"
-            if "_low_risk_" in workflow_file:
-                expected_risk = "low"
-            elif "_medium_risk_" in workflow_file:
-                expected_risk = "medium"
-            elif "_high_risk_" in workflow_file:
-                expected_risk = "high"
-            elif "_critical_risk_" in workflow_file:
-                expected_risk = "critical"
-            
-            wei_score, rps_score, actual_risk = extract_scores(workflow_file)
-            combined_score = calculate_combined_risk(wei_score, rps_score)
-            predicted_risk = categorize_risk(combined_score)
-            
-            workflows.append({
-                'id': i,
-                'file': workflow_file,
-                'expected': expected_risk,
-                'wei_score': wei_score,
-                'rps_score': rps_score,
-                'combined_score': combined_score,
-                'actual_risk': actual_risk,
-                'predicted_risk': predicted_risk
-            })
-            
-            print(f"{i:02d}. {expected_risk:8s} | Combined: {combined_score:.3f} | "
-                  f"Predicted: {predicted_risk} | Actual: {actual_risk}")
-    
+            expected_risk = next(
+                (level for token, level in EXPECTED_RISK_TOKENS if token in workflow_file),
+                "unknown")
+
+            tasks.append((i, workflow_file, expected_risk))
+
+    ids, expected, wei_scores, rps_scores, actual_risks, actual_shorts = \
+        compute_risk_metrics(tuple(tasks))
+    n = len(tasks)
+    expected_upper = [level.upper() for level in expected]
+
+    combined_scores, predicted_risks = rebalance(wei_scores, rps_scores)
+
+    for idx in range(n):
+        lines.append(f"{ids[idx]:02d}. {expected[idx]:8s} | Combined: {combined_scores[idx]:.3f} | "
+                     f"Predicted: {predicted_risks[idx]} | Actual: {actual_risks[idx]}")
+
     # Analyze accuracy
-    print("\n" + "=" * 50)
-    print("Accuracy Analysis:")
-    print("=" * 50)
-    
-    correct = 0
-    total = len(workflows)
-    
-    # Count risk level distribution
-    risk_distribution = {'low': [], 'medium': [], 'high': [], 'critical': []}
-    
-    for w in workflows:
-        risk_distribution[w['expected']].append(w['combined_score'])
-        
-        # Check if prediction matches expectation (simplified)
-        expected_simplified = w['expected'].upper()
-        actual_simplified = w['actual_risk'].split()[-2] if len(w['actual_risk'].split()) > 1 else w['actual_risk']
-        
-        if expected_simplified in actual_simplified:
-            correct += 1
-    
+    lines.extend(("", SEP, "Accuracy Analysis:", SEP))
+
+    total = n
+    # Tokens were canonicalized at extraction time, so the check is a
+    # straight membership test with no per-record splits or upper-casing
+    correct = sum(1 for exp, act in zip(expected_upper, actual_shorts) if exp in act)
+
     accuracy = (correct / total) * 100 if total > 0 else 0
-    print(f"Overall Accuracy: {correct}/{total} ({accuracy:.1f}%)")
-    
-    # Show distribution stats
-    print("\nCombined Score Distribution by Expected Risk:")
-    print("-" * 50)
-    for risk_level, scores in risk_distribution.items():
-        if scores:
-            avg_score = sum(scores) / len(scores)
-            min_score = min(scores)
-            max_score = max(scores)
-            print(f"{risk_level:8s}: avg={avg_score:.3f}, min={min_score:.3f}, max={max_score:.3f}")
-    
+    lines.append(f"Overall Accuracy: {correct}/{total} ({accuracy:.1f}%)")
+
+    # Group combined scores per expected level with boolean masks
+    level_scores = {level: combined_scores[expected == level]
+                    for level in ('low', 'medium', 'high', 'critical')}
+
+    # Show distribution stats (vectorized per level)
+    lines.extend(("", "Combined Score Distribution by Expected Risk:", DASH))
+    for risk_level, scores in level_scores.items():
+        if scores.size:
+            lines.append(f"{risk_level:8s}: avg={scores.mean():.3f}, "
+                         f"min={scores.min():.3f}, max={scores.max():.3f}")
+
     # Suggest new thresholds
-    print("\nSuggested Threshold Adjustments:")
-    print("-" * 50)
-    
-    all_low = [w['combined_score'] for w in workflows if w['expected'] == 'low']
-    all_medium = [w['combined_score'] for w in workflows if w['expected'] == 'medium']
-    all_high = [w['combined_score'] for w in workflows if w['expected'] == 'high']
-    all_critical = [w['combined_score'] for w in workflows if w['expected'] == 'critical']
-    
-    if all_low and all_medium:
-        low_high = max(all_low)
-        medium_low = min(all_medium)
-        suggested_low_medium = (low_high + medium_low) / 2
-        print(f"Low/Medium boundary: {suggested_low_medium:.3f} (current: 0.30)")
-    
-    if all_medium and all_high:
-        medium_high = max(all_medium)
-        high_low = min(all_high)
-        suggested_medium_high = (medium_high + high_low) / 2
-        print(f"Medium/High boundary: {suggested_medium_high:.3f} (current: 0.55)")
-    
-    if all_high and all_critical:
-        high_high = max(all_high)
-        critical_low = min(all_critical)
-        suggested_high_critical = (high_high + critical_low) / 2
-        print(f"High/Critical boundary: {suggested_high_critical:.3f} (current: 0.75)")
+    lines.extend(("", "Suggested Threshold Adjustments:", DASH))
+
+    boundaries = [
+        ('Low/Medium', 'low', 'medium', 0.30),
+        ('Medium/High', 'medium', 'high', 0.55),
+        ('High/Critical', 'high', 'critical', 0.75),
+    ]
+    for name, lower, upper, current in boundaries:
+        if level_scores[lower].size and level_scores[upper].size:
+            suggested = (level_scores[lower].max() + level_scores[upper].min()) / 2
+            lines.append(f"{name} boundary: {suggested:.3f} (current: {current:.2f})")
+
+    sys.stdout.write('\n'.join(lines) + '\n')
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -6,7 +6,6 @@ Simple script to launch the Streamlit web interface
 
 import os
 import sys
-import subprocess
 
 def main():
     """Launch the MAESTRO Streamlit GUI"""
@@ -32,15 +31,17 @@ def main():
         print("🌐 The browser should open automatically...")
         print("🛑 Press Ctrl+C to stop the server")
         print("=" * 60)
-        
-        # Run streamlit
-        subprocess.run([
+        sys.stdout.flush()
+
+        # Replace this launcher process with streamlit instead of keeping
+        # an idle parent Python interpreter alive for the server's lifetime
+        os.execvp(sys.executable, [
             sys.executable, "-m", "streamlit", "run", app_path,
             "--server.port", "8501",
             "--server.address", "localhost",
             "--browser.gatherUsageStats", "false"
         ])
-        
+
     except KeyboardInterrupt:
         print("\n🛑 MAESTRO GUI stopped by user")
         return 0
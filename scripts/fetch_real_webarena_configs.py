@@ -7,150 +7,504 @@ and converts them to MAESTRO threat assessment workflow format.
 """
 
 import json
+try:
+    # Rust-backed parser: several times faster than stdlib json on the
+    # small config documents fetched here, and it works on raw bytes
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+try:
+    # Incremental JSON parser: lets the tree listing stop parsing as soon
+    # as enough config entries have been seen
+    import ijson
+except ImportError:
+    ijson = None
 import yaml
+try:
+    # libyaml emitter is ~10x faster than the pure-Python one
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import argparse
-from datetime import datetime
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+import hashlib
+import tarfile
+import textwrap
+import threading
 import time
+import types
+
+# (connect, read) timeout applied to every GitHub request
+_REQUEST_TIMEOUT = (3.05, 30)
+
+# Metadata fields shared by every generated workflow; a read-only mapping
+# merged into each document instead of re-allocating the literals per
+# conversion (both dumpers serialize the tuple as a YAML/JSON list)
+_STATIC_METADATA = types.MappingProxyType({
+    "version": "1.0",
+    "compliance_frameworks": ("SOC2", "GDPR", "NIST_CSF", "ISO27001"),
+    "mcp_version": "1.2",
+    "a2a_protocol": "secure_mesh",
+    "source": "webarena_github"
+})
+
+# Security mappings for different task types, frozen once at import so the
+# converter never rebuilds these literals per call
+_SECURITY_MAPPINGS = {
+    "shopping": {
+        "category": "e-commerce",
+        "security_focus": "financial_transactions",
+        "threats": ("payment_fraud", "data_breach", "session_hijacking"),
+        "mcp_protocols": ("payment_processing", "identity_verification"),
+        "a2a_patterns": ("payment_gateway_coordination", "inventory_synchronization")
+    },
+    "reddit": {
+        "category": "social_media",
+        "security_focus": "content_security",
+        "threats": ("malicious_content", "privacy_violation", "misinformation"),
+        "mcp_protocols": ("content_moderation", "user_authentication"),
+        "a2a_patterns": ("cross_platform_moderation", "threat_intelligence_sharing")
+    },
+    "gitlab": {
+        "category": "devops",
+        "security_focus": "code_integrity",
+        "threats": ("supply_chain_attack", "code_injection", "credential_exposure"),
+        "mcp_protocols": ("ci_cd_security", "repository_scanning"),
+        "a2a_patterns": ("development_security_coordination", "automated_testing_orchestration")
+    },
+    "wikipedia": {
+        "category": "knowledge_management",
+        "security_focus": "information_integrity",
+        "threats": ("information_manipulation", "source_spoofing", "vandalism"),
+        "mcp_protocols": ("fact_verification", "edit_validation"),
+        "a2a_patterns": ("collaborative_verification", "knowledge_graph_validation")
+    },
+    "map": {
+        "category": "geospatial",
+        "security_focus": "location_privacy",
+        "threats": ("location_tracking", "privacy_invasion", "data_correlation"),
+        "mcp_protocols": ("location_anonymization", "geofencing_controls"),
+        "a2a_patterns": ("distributed_mapping", "privacy_preserving_routing")
+    }
+}
+
+# Static WebArena-style configs used when GitHub is unavailable; only the
+# fetch timestamp varies per run, so everything else is built once here
+_FALLBACK_CONFIGS_TEMPLATE = (
+    {
+        "task_id": 201,
+        "intent": "Add a specific item to shopping cart and complete checkout with security verification",
+        "sites": ["shopping"],
+        "start_url": "http://shop.domain.com:7770",
+        "require_login": True,
+        "storage_state": ".auth/shopping_state.json",
+        "eval": {
+            "eval_types": ["string_match", "url_match"],
+            "reference_answers": {
+                "exact_match": "Order placed successfully",
+                "must_include": ["payment", "confirmation"]
+            }
+        },
+        "_github_meta": {
+            "filename": "fallback_shopping_201.json",
+            "url": "generated",
+            "fetched_at": None
+        }
+    },
+    {
+        "task_id": 202,
+        "intent": "Create and moderate a discussion thread with content policy enforcement",
+        "sites": ["reddit"],
+        "start_url": "http://reddit.domain.com:9999",
+        "require_login": True,
+        "storage_state": ".auth/reddit_state.json",
+        "eval": {
+            "eval_types": ["string_match", "program"],
+            "reference_answers": {
+                "exact_match": "Thread created and moderated",
+                "must_include": ["community guidelines", "moderation"]
+            }
+        },
+        "_github_meta": {
+            "filename": "fallback_reddit_202.json",
+            "url": "generated",
+            "fetched_at": None
+        }
+    }
+)
+
+# Domain-specific security actions keyed by site, likewise built once
+_DOMAIN_ACTIONS = {
+    "shopping": {
+        "id": "ecommerce_security_transaction",
+        "agent": "ECommerceSecurityAgent",
+        "action": "execute_secure_ecommerce_workflow",
+        "params": {
+            "payment_security": "pci_dss_level_1",
+            "transaction_monitoring": "real_time_fraud_detection",
+            "data_encryption": "end_to_end",
+            "session_security": "secure_cookie_management",
+            "inventory_protection": "atomic_transactions",
+            "customer_data_protection": "gdpr_compliant",
+            "mcp_payment_controls": "tokenized_processing"
+        }
+    },
+    "reddit": {
+        "id": "social_media_security_moderation",
+        "agent": "SocialMediaSecurityAgent",
+        "action": "execute_secure_content_workflow",
+        "params": {
+            "content_security_scanning": "multi_modal_analysis",
+            "user_behavior_monitoring": "anomaly_detection",
+            "privacy_protection": "data_minimization",
+            "misinformation_detection": "fact_checking_integration",
+            "harassment_prevention": "proactive_filtering",
+            "community_safety": "real_time_moderation",
+            "mcp_content_controls": "adaptive_filtering"
+        }
+    },
+    "gitlab": {
+        "id": "devops_security_pipeline",
+        "agent": "DevOpsSecurityAgent",
+        "action": "execute_secure_development_workflow",
+        "params": {
+            "code_security_analysis": "sast_dast_iast",
+            "dependency_security": "sca_vulnerability_scanning",
+            "container_security": "image_scanning_runtime_protection",
+            "secret_management": "vault_integration_rotation",
+            "infrastructure_security": "iac_scanning",
+            "deployment_security": "zero_downtime_rollback",
+            "mcp_pipeline_controls": "policy_as_code_enforcement"
+        }
+    },
+    "wikipedia": {
+        "id": "knowledge_security_verification",
+        "agent": "KnowledgeSecurityAgent",
+        "action": "execute_secure_information_workflow",
+        "params": {
+            "information_integrity": "cryptographic_verification",
+            "source_validation": "trust_network_analysis",
+            "edit_security": "authenticated_contributions",
+            "vandalism_detection": "ml_pattern_recognition",
+            "fact_verification": "multi_source_validation",
+            "bias_detection": "algorithmic_fairness",
+            "mcp_knowledge_controls": "consensus_verification"
+        }
+    },
+    "map": {
+        "id": "geospatial_security_processing",
+        "agent": "GeospatialSecurityAgent",
+        "action": "execute_secure_location_workflow",
+        "params": {
+            "location_privacy": "differential_privacy_k_anonymity",
+            "route_security": "privacy_preserving_pathfinding",
+            "data_minimization": "purpose_limited_collection",
+            "consent_management": "granular_permissions",
+            "tracking_prevention": "anti_surveillance_measures",
+            "geofencing_security": "encrypted_boundary_detection",
+            "mcp_location_controls": "zero_knowledge_positioning"
+        }
+    }
+}
 
 class RealWebArenaFetcher:
     def __init__(self, output_dir: str = "examples"):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
-        
-        # GitHub URLs for WebArena config files
-        self.github_urls = {
-            "webarena_configs": "https://api.github.com/repos/web-arena-x/webarena/contents/config_files",
-            "visualwebarena_configs": "https://api.github.com/repos/web-arena-x/visualwebarena/contents/config_files"
+
+        # One pooled session for every GitHub request: keep-alive avoids a
+        # fresh TCP+TLS handshake per file, which dominates small downloads
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3,
+                              status_forcelist=[502, 503, 504])
+        )
+        self._session.mount("https://api.github.com", adapter)
+        self._session.mount("https://raw.githubusercontent.com", adapter)
+
+        # On-disk response cache keyed by URL: bodies live next to a JSON
+        # index of their ETags so repeat runs revalidate with
+        # If-None-Match and get cheap 304s instead of full downloads
+        # Step skeletons are identical for every config with the same site
+        # and login requirement, so cache them serialized as JSON and
+        # rehydrate per conversion (cheaper than deepcopying nested dicts)
+        self._skeleton_cache: Dict[Tuple[str, bool], Any] = {}
+        # Pre-rendered YAML for each cached skeleton: the steps block is by
+        # far the largest part of the document and identical per key, so it
+        # only ever goes through the emitter once
+        self._steps_yaml_cache: Dict[Tuple[str, bool], str] = {}
+
+        self._cache_dir = self.output_dir / ".cache"
+        self._cache_dir.mkdir(exist_ok=True)
+        self._cache_index_path = self._cache_dir / "index.json"
+        self._cache_lock = threading.Lock()
+        try:
+            with open(self._cache_index_path) as f:
+                self._cache_index = json.load(f)
+        except (OSError, ValueError):
+            self._cache_index = {}
+
+        # GitHub repositories holding WebArena config files
+        self.github_repos = {
+            "webarena_configs": "web-arena-x/webarena",
+            "visualwebarena_configs": "web-arena-x/visualwebarena"
         }
         
-        # Security mappings for different task types
-        self.security_mappings = {
-            "shopping": {
-                "category": "e-commerce",
-                "security_focus": "financial_transactions",
-                "threats": ["payment_fraud", "data_breach", "session_hijacking"],
-                "mcp_protocols": ["payment_processing", "identity_verification"],
-                "a2a_patterns": ["payment_gateway_coordination", "inventory_synchronization"]
-            },
-            "reddit": {
-                "category": "social_media",
-                "security_focus": "content_security",
-                "threats": ["malicious_content", "privacy_violation", "misinformation"],
-                "mcp_protocols": ["content_moderation", "user_authentication"],
-                "a2a_patterns": ["cross_platform_moderation", "threat_intelligence_sharing"]
-            },
-            "gitlab": {
-                "category": "devops",
-                "security_focus": "code_integrity",
-                "threats": ["supply_chain_attack", "code_injection", "credential_exposure"],
-                "mcp_protocols": ["ci_cd_security", "repository_scanning"],
-                "a2a_patterns": ["development_security_coordination", "automated_testing_orchestration"]
-            },
-            "wikipedia": {
-                "category": "knowledge_management",
-                "security_focus": "information_integrity",
-                "threats": ["information_manipulation", "source_spoofing", "vandalism"],
-                "mcp_protocols": ["fact_verification", "edit_validation"],
-                "a2a_patterns": ["collaborative_verification", "knowledge_graph_validation"]
-            },
-            "map": {
-                "category": "geospatial",
-                "security_focus": "location_privacy",
-                "threats": ["location_tracking", "privacy_invasion", "data_correlation"],
-                "mcp_protocols": ["location_anonymization", "geofencing_controls"],
-                "a2a_patterns": ["distributed_mapping", "privacy_preserving_routing"]
-            }
-        }
+        # Security mappings for different task types (shared module constant)
+        self.security_mappings = _SECURITY_MAPPINGS
     
     def fetch_github_configs(self, repo_type: str = "webarena_configs", limit: int = 10) -> List[Dict[str, Any]]:
         """Fetch actual config files from GitHub"""
         configs = []
-        
+
         try:
-            url = self.github_urls[repo_type]
-            response = requests.get(url)
+            repo = self.github_repos[repo_type]
+
+            # For bulk fetches one streamed tarball beats N raw-file round
+            # trips, so switch strategy above this threshold
+            if limit >= 20:
+                return self._fetch_from_tarball(repo, limit)
+
+            json_files = self._list_config_files(repo, limit)
+
+            # One timestamp per batch: stamping each file individually costs
+            # a syscall + format per config and makes cache keys unstable
+            fetched_at = datetime.now(timezone.utc).isoformat()
+
+            # Downloads are network-bound and independent, so fan them out
+            # over a small thread pool instead of serializing GET + sleep
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                futures = {executor.submit(self._fetch_one, file_info, fetched_at): file_info
+                           for file_info in json_files}
+                for future in as_completed(futures):
+                    file_info = futures[future]
+                    try:
+                        configs.append(future.result())
+                        print(f"Fetched: {file_info['name']}")
+                    except Exception as e:
+                        print(f"Error fetching {file_info['name']}: {str(e)}")
+                        continue
+
+
+        except Exception as e:
+            print(f"Error fetching from GitHub: {str(e)}")
+            # Fallback to sample configs if GitHub fetch fails
+            return self._generate_fallback_configs()
+        
+        return configs
+
+    def _list_config_files(self, repo: str, limit: int) -> List[Dict[str, Any]]:
+        """List the first `limit` JSON config files in the repo
+
+        The Git Trees API returns the whole directory listing in one request
+        (the contents API paginates at 1000 entries). When ijson is
+        available and the listing is not already cached, the response is
+        parsed incrementally so only ~limit entries are ever materialized
+        and the transfer stops early on large repos.
+        """
+        url = f"https://api.github.com/repos/{repo}/git/trees/main?recursive=1"
+
+        with self._cache_lock:
+            listing_cached = url in self._cache_index
+
+        if ijson is not None and not listing_cached:
+            response = self._session.get(url, stream=True, timeout=_REQUEST_TIMEOUT)
             response.raise_for_status()
-            
-            files = response.json()
-            
-            # Filter for JSON config files
-            json_files = [f for f in files if f['name'].endswith('.json')][:limit]
-            
-            for file_info in json_files:
-                try:
-                    # Fetch individual file content
-                    file_response = requests.get(file_info['download_url'])
-                    file_response.raise_for_status()
-                    
-                    config = json.loads(file_response.text)
+            response.raw.decode_content = True
+            json_files = []
+            try:
+                for entry in ijson.items(response.raw, 'tree.item'):
+                    path = entry.get('path', '')
+                    if path.startswith('config_files/') and path.endswith('.json'):
+                        json_files.append({
+                            'name': path.rsplit('/', 1)[-1],
+                            'download_url': f"https://raw.githubusercontent.com/{repo}/main/{path}"
+                        })
+                        if len(json_files) >= limit:
+                            break
+            finally:
+                response.close()
+            return json_files
+
+        tree = _json_loads(self._cached_get(url)).get('tree', [])
+        return self._tree_to_files(repo, tree, limit)
+
+    @staticmethod
+    def _tree_to_files(repo: str, tree: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+        """Filter tree entries down to JSON config file descriptors"""
+        return [
+            {
+                'name': entry['path'].rsplit('/', 1)[-1],
+                'download_url': f"https://raw.githubusercontent.com/{repo}/main/{entry['path']}"
+            }
+            for entry in tree
+            if entry['path'].startswith('config_files/') and entry['path'].endswith('.json')
+        ][:limit]
+
+    def fetch_github_configs_async(self, repo_type: str = "webarena_configs", limit: int = 10) -> List[Dict[str, Any]]:
+        """Async variant of fetch_github_configs for heavier fetches
+
+        Multiplexes the listing and all file downloads over one event loop
+        with keep-alive connections. Falls back to the threaded fetcher when
+        aiohttp is not installed, so callers can opt in unconditionally.
+        """
+        try:
+            import aiohttp  # noqa: F401
+        except ImportError:
+            return self.fetch_github_configs(repo_type, limit)
+        return asyncio.run(self._afetch_github_configs(repo_type, limit))
+
+    async def _afetch_github_configs(self, repo_type: str, limit: int) -> List[Dict[str, Any]]:
+        """Fetch the listing and all config files over a single event loop"""
+        import aiohttp
+
+        configs = []
+        try:
+            repo = self.github_repos[repo_type]
+            url = f"https://api.github.com/repos/{repo}/git/trees/main?recursive=1"
+            fetched_at = datetime.now(timezone.utc).isoformat()
+
+            timeout = aiohttp.ClientTimeout(sock_connect=_REQUEST_TIMEOUT[0],
+                                            sock_read=_REQUEST_TIMEOUT[1])
+            connector = aiohttp.TCPConnector(limit=16, keepalive_timeout=30)
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+                async with session.get(url) as response:
+                    response.raise_for_status()
+                    tree = _json_loads(await response.read()).get('tree', [])
+
+                json_files = self._tree_to_files(repo, tree, limit)
+
+                async def fetch_one(file_info):
+                    async with session.get(file_info['download_url']) as file_response:
+                        file_response.raise_for_status()
+                        config = _json_loads(await file_response.read())
                     config['_github_meta'] = {
                         'filename': file_info['name'],
                         'url': file_info['download_url'],
-                        'fetched_at': datetime.now().isoformat()
+                        'fetched_at': fetched_at
                     }
-                    configs.append(config)
-                    
-                    print(f"Fetched: {file_info['name']}")
-                    time.sleep(0.5)  # Rate limiting
-                    
-                except Exception as e:
-                    print(f"Error fetching {file_info['name']}: {str(e)}")
-                    continue
-                    
+                    return config
+
+                results = await asyncio.gather(
+                    *(fetch_one(file_info) for file_info in json_files),
+                    return_exceptions=True)
+                for file_info, result in zip(json_files, results):
+                    if isinstance(result, Exception):
+                        print(f"Error fetching {file_info['name']}: {str(result)}")
+                    else:
+                        configs.append(result)
+                        print(f"Fetched: {file_info['name']}")
+
         except Exception as e:
             print(f"Error fetching from GitHub: {str(e)}")
-            # Fallback to sample configs if GitHub fetch fails
             return self._generate_fallback_configs()
-        
+
         return configs
-    
+
+    def _fetch_from_tarball(self, repo: str, limit: int) -> List[Dict[str, Any]]:
+        """Stream the repo tarball and read config files out of it
+
+        One gzip-compressed transfer replaces a GET per config file; members
+        are decoded straight from the tar stream without touching disk.
+        """
+        configs = []
+        url = f"https://codeload.github.com/{repo}/tar.gz/refs/heads/main"
+        response = self._session.get(url, stream=True, timeout=_REQUEST_TIMEOUT)
+        response.raise_for_status()
+
+        fetched_at = datetime.now(timezone.utc).isoformat()
+        with tarfile.open(fileobj=response.raw, mode='r|gz') as archive:
+            for member in archive:
+                # Tarball paths are prefixed with "<repo>-<ref>/"
+                relative_path = member.name.split('/', 1)[-1]
+                if not (relative_path.startswith('config_files/')
+                        and relative_path.endswith('.json')
+                        and member.isfile()):
+                    continue
+
+                filename = relative_path.rsplit('/', 1)[-1]
+                try:
+                    config = _json_loads(archive.extractfile(member).read())
+                    config['_github_meta'] = {
+                        'filename': filename,
+                        'url': f"https://raw.githubusercontent.com/{repo}/main/{relative_path}",
+                        'fetched_at': fetched_at
+                    }
+                    configs.append(config)
+                    print(f"Fetched: {filename}")
+                except Exception as e:
+                    print(f"Error fetching {filename}: {str(e)}")
+                    continue
+
+                if len(configs) >= limit:
+                    break
+
+        return configs
+
+    def _cached_get(self, url: str) -> bytes:
+        """GET a URL with ETag revalidation against the on-disk cache"""
+        headers = {}
+        body_path = None
+        with self._cache_lock:
+            entry = self._cache_index.get(url)
+        if entry:
+            body_path = self._cache_dir / entry['body']
+            if body_path.exists():
+                headers['If-None-Match'] = entry['etag']
+
+        response = self._session.get(url, headers=headers, timeout=_REQUEST_TIMEOUT)
+
+        # Back off only when GitHub actually throttles us, instead of
+        # sleeping a fixed interval between every download
+        if response.status_code == 403 and \
+                response.headers.get('X-RateLimit-Remaining') == '0':
+            delay = float(response.headers.get('Retry-After', 1.0))
+            time.sleep(delay)
+            response = self._session.get(url, headers=headers, timeout=_REQUEST_TIMEOUT)
+
+        if response.status_code == 304:
+            return body_path.read_bytes()
+        response.raise_for_status()
+
+        etag = response.headers.get('ETag')
+        if etag:
+            body_name = hashlib.sha256(url.encode()).hexdigest() + ".body"
+            (self._cache_dir / body_name).write_bytes(response.content)
+            with self._cache_lock:
+                self._cache_index[url] = {'etag': etag, 'body': body_name}
+                with open(self._cache_index_path, 'w') as f:
+                    json.dump(self._cache_index, f)
+
+        return response.content
+
+    def _fetch_one(self, file_info: Dict[str, Any], fetched_at: str) -> Dict[str, Any]:
+        """Download and parse a single config file"""
+        config = _json_loads(self._cached_get(file_info['download_url']))
+        config['_github_meta'] = {
+            'filename': file_info['name'],
+            'url': file_info['download_url'],
+            'fetched_at': fetched_at
+        }
+        return config
+
     def _generate_fallback_configs(self) -> List[Dict[str, Any]]:
         """Generate realistic WebArena-style configs when GitHub is unavailable"""
+        fetched_at = datetime.now(timezone.utc).isoformat()
         return [
-            {
-                "task_id": 201,
-                "intent": "Add a specific item to shopping cart and complete checkout with security verification",
-                "sites": ["shopping"],
-                "start_url": "http://shop.domain.com:7770",
-                "require_login": True,
-                "storage_state": ".auth/shopping_state.json",
-                "eval": {
-                    "eval_types": ["string_match", "url_match"],
-                    "reference_answers": {
-                        "exact_match": "Order placed successfully",
-                        "must_include": ["payment", "confirmation"]
-                    }
-                },
-                "_github_meta": {
-                    "filename": "fallback_shopping_201.json",
-                    "url": "generated",
-                    "fetched_at": datetime.now().isoformat()
-                }
-            },
-            {
-                "task_id": 202,
-                "intent": "Create and moderate a discussion thread with content policy enforcement",
-                "sites": ["reddit"],
-                "start_url": "http://reddit.domain.com:9999",
-                "require_login": True,
-                "storage_state": ".auth/reddit_state.json",
-                "eval": {
-                    "eval_types": ["string_match", "program"],
-                    "reference_answers": {
-                        "exact_match": "Thread created and moderated",
-                        "must_include": ["community guidelines", "moderation"]
-                    }
-                },
-                "_github_meta": {
-                    "filename": "fallback_reddit_202.json",
-                    "url": "generated",
-                    "fetched_at": datetime.now().isoformat()
-                }
-            }
+            {**config, "_github_meta": {**config["_github_meta"], "fetched_at": fetched_at}}
+            for config in _FALLBACK_CONFIGS_TEMPLATE
         ]
     
     def convert_to_maestro(self, webarena_config: Dict[str, Any]) -> Dict[str, Any]:
@@ -170,13 +524,9 @@ class RealWebArenaFetcher:
                 "name": f"WebArena_Security_{primary_site}_{task_id}",
                 "description": f"MAESTRO security assessment for: {intent}",
                 "metadata": {
-                    "version": "1.0",
+                    **_STATIC_METADATA,
                     "category": security_mapping["category"],
                     "sensitivity": "high" if webarena_config.get("require_login") else "medium",
-                    "compliance_frameworks": ["SOC2", "GDPR", "NIST_CSF", "ISO27001"],
-                    "mcp_version": "1.2",
-                    "a2a_protocol": "secure_mesh",
-                    "source": "webarena_github",
                     "original_config": webarena_config.get("_github_meta", {}),
                     "threat_model": security_mapping["threats"],
                     "security_focus": security_mapping["security_focus"]
@@ -185,35 +535,160 @@ class RealWebArenaFetcher:
             }
         }
         
-        # Generate comprehensive security workflow steps
-        steps = self._generate_security_workflow_steps(webarena_config, security_mapping)
-        workflow["workflow"]["steps"] = steps
-        
+        # Generate comprehensive security workflow steps. The steps only
+        # depend on the site and login requirement, so reuse the cached
+        # skeleton when one exists
+        cache_key = (primary_site, bool(webarena_config.get("require_login")))
+        template = self._skeleton_cache.get(cache_key)
+        if template is None:
+            steps = self._generate_security_workflow_steps(webarena_config, security_mapping)
+            template = orjson.dumps(steps) if orjson else json.dumps(steps)
+            self._skeleton_cache[cache_key] = template
+        workflow["workflow"]["steps"] = _json_loads(template)
+
         return workflow
     
     def _generate_security_workflow_steps(self, config: Dict[str, Any], mapping: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate comprehensive security workflow steps"""
-        steps = []
-        
-        # Step 1: Threat Intelligence Gathering
-        steps.append({
-            "id": "threat_intelligence_collection",
-            "agent": "ThreatIntelligenceAgent",
-            "action": "gather_contextual_threats",
-            "params": {
-                "domain_category": mapping["category"],
-                "known_threats": mapping["threats"],
-                "intelligence_sources": ["mitre_attack", "cve_database", "threat_feeds"],
-                "time_window": "72h",
-                "mcp_intel_protocol": "secure_aggregation"
+        # Step 4: Domain-Specific Security Action
+        domain_action = self._generate_domain_security_action(config, mapping)
+
+        # Build the fixed pipeline as one list literal; the optional
+        # authentication step is spliced in afterwards
+        steps = [
+            # Step 1: Threat Intelligence Gathering
+            {
+                "id": "threat_intelligence_collection",
+                "agent": "ThreatIntelligenceAgent",
+                "action": "gather_contextual_threats",
+                "params": {
+                    "domain_category": mapping["category"],
+                    "known_threats": mapping["threats"],
+                    "intelligence_sources": ("mitre_attack", "cve_database", "threat_feeds"),
+                    "time_window": "72h",
+                    "mcp_intel_protocol": "secure_aggregation"
+                },
+                "dependencies": ()
             },
-            "dependencies": []
-        })
-        
-        # Step 2: Environment Security Setup
-        auth_deps = []
+            # Step 3: Secure Environment Preparation
+            {
+                "id": "secure_environment_initialization",
+                "agent": "SecureEnvironmentAgent",
+                "action": "initialize_hardened_workspace",
+                "params": {
+                    "isolation_level": "maximum",
+                    "network_segmentation": "micro_segmentation",
+                    "monitoring_coverage": "comprehensive",
+                    "data_loss_prevention": "active",
+                    "endpoint_protection": "advanced",
+                    "mcp_environment_controls": "policy_enforced"
+                },
+                "dependencies": ("threat_intelligence_collection",)
+            },
+            domain_action,
+            # Step 5: Real-time Security Monitoring
+            {
+                "id": "realtime_security_monitoring",
+                "agent": "SecurityMonitoringAgent",
+                "action": "continuous_threat_detection",
+                "params": {
+                    "behavioral_analysis": "ml_enhanced",
+                    "anomaly_detection": "statistical_and_ml",
+                    "threat_correlation": "multi_source",
+                    "incident_classification": "automated",
+                    "response_timing": "sub_second",
+                    "a2a_threat_sharing": "encrypted_mesh"
+                },
+                "input_from": domain_action["id"],
+                "dependencies": (domain_action["id"],)
+            },
+            # Step 6: Advanced Threat Analysis
+            {
+                "id": "advanced_threat_analysis",
+                "agent": "ThreatAnalysisAgent",
+                "action": "deep_security_analysis",
+                "params": {
+                    "static_analysis": "comprehensive",
+                    "dynamic_analysis": "sandbox_execution",
+                    "vulnerability_assessment": "continuous",
+                    "exploit_simulation": "controlled",
+                    "risk_quantification": "cvss_v4_enhanced",
+                    "mcp_analysis_controls": "sandboxed_execution"
+                },
+                "input_from": "SecurityMonitoringAgent",
+                "dependencies": ("realtime_security_monitoring",)
+            },
+            # Step 7: Multi-Agent Security Coordination
+            {
+                "id": "security_agent_coordination",
+                "agent": "SecurityCoordinationAgent",
+                "action": "orchestrate_security_response",
+                "params": {
+                    "coordination_pattern": mapping["a2a_patterns"][0],
+                    "consensus_protocol": "byzantine_fault_tolerant",
+                    "decision_framework": "risk_based",
+                    "escalation_matrix": "automated_tiered",
+                    "communication_security": "end_to_end_encrypted",
+                    "a2a_coordination_mesh": "fully_connected"
+                },
+                "input_from": "ThreatAnalysisAgent",
+                "dependencies": ("advanced_threat_analysis",)
+            },
+            # Step 8: MCP Security Compliance Verification
+            {
+                "id": "mcp_security_compliance",
+                "agent": "MCPSecurityComplianceAgent",
+                "action": "verify_protocol_security_compliance",
+                "params": {
+                    "protocol_version": "1.2",
+                    "security_standards": mapping["mcp_protocols"],
+                    "compliance_verification": "automated_testing",
+                    "security_attestation": "cryptographic",
+                    "control_effectiveness": "continuous_validation",
+                    "mcp_security_baseline": "hardened_default"
+                },
+                "input_from": "SecurityCoordinationAgent",
+                "dependencies": ("security_agent_coordination",)
+            },
+            # Step 9: Incident Response Preparation
+            {
+                "id": "incident_response_preparation",
+                "agent": "IncidentResponseAgent",
+                "action": "prepare_incident_response_capability",
+                "params": {
+                    "response_playbooks": "automated_generation",
+                    "forensic_readiness": "continuous",
+                    "evidence_preservation": "chain_of_custody",
+                    "stakeholder_notification": "automated_tiered",
+                    "recovery_procedures": "tested_and_validated",
+                    "mcp_incident_protocols": "secure_communication"
+                },
+                "input_from": "MCPSecurityComplianceAgent",
+                "dependencies": ("mcp_security_compliance",)
+            },
+            # Step 10: Security Assessment Report Generation
+            {
+                "id": "comprehensive_security_report",
+                "agent": "SecurityReportingAgent",
+                "action": "generate_comprehensive_security_assessment",
+                "params": {
+                    "report_classification": "confidential",
+                    "risk_visualization": "interactive_dashboards",
+                    "threat_landscape_analysis": "predictive",
+                    "compliance_status": "detailed_mapping",
+                    "remediation_roadmap": "prioritized_timeline",
+                    "executive_briefing": "risk_focused",
+                    "technical_appendix": "detailed_findings",
+                    "mcp_audit_evidence": "complete_trail"
+                },
+                "input_from": "IncidentResponseAgent",
+                "dependencies": ("incident_response_preparation",)
+            }
+        ]
+
+        # Step 2: Environment Security Setup (login-gated)
         if config.get("require_login"):
-            steps.append({
+            steps.insert(1, {
                 "id": "secure_authentication_setup",
                 "agent": "AuthenticationSecurityAgent",
                 "action": "establish_secure_session",
@@ -225,231 +700,46 @@ class RealWebArenaFetcher:
                     "mcp_auth_controls": "zero_trust",
                     "biometric_verification": config.get("require_login", False)
                 },
-                "dependencies": ["threat_intelligence_collection"]
+                "dependencies": ("threat_intelligence_collection",)
             })
-            auth_deps = ["secure_authentication_setup"]
-        
-        # Step 3: Secure Environment Preparation
-        steps.append({
-            "id": "secure_environment_initialization",
-            "agent": "SecureEnvironmentAgent",
-            "action": "initialize_hardened_workspace",
-            "params": {
-                "isolation_level": "maximum",
-                "network_segmentation": "micro_segmentation",
-                "monitoring_coverage": "comprehensive",
-                "data_loss_prevention": "active",
-                "endpoint_protection": "advanced",
-                "mcp_environment_controls": "policy_enforced"
-            },
-            "dependencies": ["threat_intelligence_collection"] + auth_deps
-        })
-        
-        # Step 4: Domain-Specific Security Action
-        domain_action = self._generate_domain_security_action(config, mapping)
-        steps.append(domain_action)
-        
-        # Step 5: Real-time Security Monitoring
-        steps.append({
-            "id": "realtime_security_monitoring",
-            "agent": "SecurityMonitoringAgent",
-            "action": "continuous_threat_detection",
-            "params": {
-                "behavioral_analysis": "ml_enhanced",
-                "anomaly_detection": "statistical_and_ml",
-                "threat_correlation": "multi_source",
-                "incident_classification": "automated",
-                "response_timing": "sub_second",
-                "a2a_threat_sharing": "encrypted_mesh"
-            },
-            "input_from": domain_action["id"],
-            "dependencies": [domain_action["id"]]
-        })
-        
-        # Step 6: Advanced Threat Analysis
-        steps.append({
-            "id": "advanced_threat_analysis",
-            "agent": "ThreatAnalysisAgent",
-            "action": "deep_security_analysis",
-            "params": {
-                "static_analysis": "comprehensive",
-                "dynamic_analysis": "sandbox_execution",
-                "vulnerability_assessment": "continuous",
-                "exploit_simulation": "controlled",
-                "risk_quantification": "cvss_v4_enhanced",
-                "mcp_analysis_controls": "sandboxed_execution"
-            },
-            "input_from": "SecurityMonitoringAgent",
-            "dependencies": ["realtime_security_monitoring"]
-        })
-        
-        # Step 7: Multi-Agent Security Coordination
-        steps.append({
-            "id": "security_agent_coordination",
-            "agent": "SecurityCoordinationAgent",
-            "action": "orchestrate_security_response",
-            "params": {
-                "coordination_pattern": mapping["a2a_patterns"][0],
-                "consensus_protocol": "byzantine_fault_tolerant",
-                "decision_framework": "risk_based",
-                "escalation_matrix": "automated_tiered",
-                "communication_security": "end_to_end_encrypted",
-                "a2a_coordination_mesh": "fully_connected"
-            },
-            "input_from": "ThreatAnalysisAgent",
-            "dependencies": ["advanced_threat_analysis"]
-        })
-        
-        # Step 8: MCP Security Compliance Verification
-        steps.append({
-            "id": "mcp_security_compliance",
-            "agent": "MCPSecurityComplianceAgent",
-            "action": "verify_protocol_security_compliance",
-            "params": {
-                "protocol_version": "1.2",
-                "security_standards": mapping["mcp_protocols"],
-                "compliance_verification": "automated_testing",
-                "security_attestation": "cryptographic",
-                "control_effectiveness": "continuous_validation",
-                "mcp_security_baseline": "hardened_default"
-            },
-            "input_from": "SecurityCoordinationAgent",
-            "dependencies": ["security_agent_coordination"]
-        })
-        
-        # Step 9: Incident Response Preparation
-        steps.append({
-            "id": "incident_response_preparation",
-            "agent": "IncidentResponseAgent",
-            "action": "prepare_incident_response_capability",
-            "params": {
-                "response_playbooks": "automated_generation",
-                "forensic_readiness": "continuous",
-                "evidence_preservation": "chain_of_custody",
-                "stakeholder_notification": "automated_tiered",
-                "recovery_procedures": "tested_and_validated",
-                "mcp_incident_protocols": "secure_communication"
-            },
-            "input_from": "MCPSecurityComplianceAgent",
-            "dependencies": ["mcp_security_compliance"]
-        })
-        
-        # Step 10: Security Assessment Report Generation
-        steps.append({
-            "id": "comprehensive_security_report",
-            "agent": "SecurityReportingAgent",
-            "action": "generate_comprehensive_security_assessment",
-            "params": {
-                "report_classification": "confidential",
-                "risk_visualization": "interactive_dashboards",
-                "threat_landscape_analysis": "predictive",
-                "compliance_status": "detailed_mapping",
-                "remediation_roadmap": "prioritized_timeline",
-                "executive_briefing": "risk_focused",
-                "technical_appendix": "detailed_findings",
-                "mcp_audit_evidence": "complete_trail"
-            },
-            "input_from": "IncidentResponseAgent",
-            "dependencies": ["incident_response_preparation"]
-        })
-        
+            steps[2]["dependencies"] = ("threat_intelligence_collection",
+                                        "secure_authentication_setup")
+
         return steps
-    
+
     def _generate_domain_security_action(self, config: Dict[str, Any], mapping: Dict[str, Any]) -> Dict[str, Any]:
         """Generate domain-specific security action based on the site type"""
         
         sites = config.get("sites", ["shopping"])
         primary_site = sites[0] if sites else "shopping"
-        
-        actions = {
-            "shopping": {
-                "id": "ecommerce_security_transaction",
-                "agent": "ECommerceSecurityAgent",
-                "action": "execute_secure_ecommerce_workflow",
-                "params": {
-                    "payment_security": "pci_dss_level_1",
-                    "transaction_monitoring": "real_time_fraud_detection",
-                    "data_encryption": "end_to_end",
-                    "session_security": "secure_cookie_management",
-                    "inventory_protection": "atomic_transactions",
-                    "customer_data_protection": "gdpr_compliant",
-                    "mcp_payment_controls": "tokenized_processing"
-                }
-            },
-            "reddit": {
-                "id": "social_media_security_moderation",
-                "agent": "SocialMediaSecurityAgent",
-                "action": "execute_secure_content_workflow",
-                "params": {
-                    "content_security_scanning": "multi_modal_analysis",
-                    "user_behavior_monitoring": "anomaly_detection",
-                    "privacy_protection": "data_minimization",
-                    "misinformation_detection": "fact_checking_integration",
-                    "harassment_prevention": "proactive_filtering",
-                    "community_safety": "real_time_moderation",
-                    "mcp_content_controls": "adaptive_filtering"
-                }
-            },
-            "gitlab": {
-                "id": "devops_security_pipeline",
-                "agent": "DevOpsSecurityAgent",
-                "action": "execute_secure_development_workflow",
-                "params": {
-                    "code_security_analysis": "sast_dast_iast",
-                    "dependency_security": "sca_vulnerability_scanning",
-                    "container_security": "image_scanning_runtime_protection",
-                    "secret_management": "vault_integration_rotation",
-                    "infrastructure_security": "iac_scanning",
-                    "deployment_security": "zero_downtime_rollback",
-                    "mcp_pipeline_controls": "policy_as_code_enforcement"
-                }
-            },
-            "wikipedia": {
-                "id": "knowledge_security_verification",
-                "agent": "KnowledgeSecurityAgent",
-                "action": "execute_secure_information_workflow",
-                "params": {
-                    "information_integrity": "cryptographic_verification",
-                    "source_validation": "trust_network_analysis",
-                    "edit_security": "authenticated_contributions",
-                    "vandalism_detection": "ml_pattern_recognition",
-                    "fact_verification": "multi_source_validation",
-                    "bias_detection": "algorithmic_fairness",
-                    "mcp_knowledge_controls": "consensus_verification"
-                }
-            },
-            "map": {
-                "id": "geospatial_security_processing",
-                "agent": "GeospatialSecurityAgent",
-                "action": "execute_secure_location_workflow",
-                "params": {
-                    "location_privacy": "differential_privacy_k_anonymity",
-                    "route_security": "privacy_preserving_pathfinding",
-                    "data_minimization": "purpose_limited_collection",
-                    "consent_management": "granular_permissions",
-                    "tracking_prevention": "anti_surveillance_measures",
-                    "geofencing_security": "encrypted_boundary_detection",
-                    "mcp_location_controls": "zero_knowledge_positioning"
-                }
-            }
-        }
-        
-        action = actions.get(primary_site, actions["shopping"]).copy()
-        action["dependencies"] = ["secure_environment_initialization"]
+
+        action = _DOMAIN_ACTIONS.get(primary_site, _DOMAIN_ACTIONS["shopping"]).copy()
+        action["dependencies"] = ("secure_environment_initialization",)
         action["input_from"] = "SecureEnvironmentAgent"
         
         return action
     
+    def close(self):
+        """Release the pooled HTTP connections"""
+        self._session.close()
+
     def save_workflow(self, workflow: Dict[str, Any], filename: str):
         """Save workflow to YAML file"""
         output_path = self.output_dir / filename
-        with open(output_path, 'w') as f:
-            yaml.dump(workflow, f, default_flow_style=False, indent=2, sort_keys=False)
+        with open(output_path, 'wb') as f:
+            yaml.dump(workflow, f, Dumper=YamlDumper, default_flow_style=False,
+                      indent=2, sort_keys=False, allow_unicode=True,
+                      encoding='utf-8')
         print(f"Saved security workflow to {output_path}")
     
-    def fetch_and_convert_all(self, limit: int = 5):
+    def fetch_and_convert_all(self, limit: int = 5, force: bool = False):
         """Fetch real WebArena configs and convert to MAESTRO security workflows"""
         print("Fetching WebArena configurations from GitHub...")
+
+        # Task IDs are stable, so workflows that already exist on disk need
+        # no re-conversion unless the caller forces it
+        existing = frozenset() if force else \
+            {p.name for p in self.output_dir.glob("webarena_security_*.yaml")}
         
         # Try to fetch from both repositories
         all_configs = []
@@ -467,35 +757,80 @@ class RealWebArenaFetcher:
             all_configs = self._generate_fallback_configs()
         
         print(f"\nConverting {len(all_configs)} configurations to MAESTRO security workflows...")
-        
-        for config in all_configs:
-            try:
-                workflow = self.convert_to_maestro(config)
-                
-                # Generate filename
-                task_id = config.get("task_id", "unknown")
-                sites = config.get("sites", ["generic"])
-                primary_site = sites[0] if sites else "generic"
-                
-                filename = f"webarena_security_{primary_site}_{task_id}.yaml"
-                self.save_workflow(workflow, filename)
-                
-            except Exception as e:
-                print(f"Error converting config {config.get('task_id', 'unknown')}: {str(e)}")
-        
+
+        # Conversions are independent, so overlap YAML emission with the
+        # per-file write syscalls across a thread pool
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            list(executor.map(lambda config: self._convert_and_save(config, existing),
+                              all_configs))
+
         print(f"\nConversion complete! Files saved in: {self.output_dir}")
 
+    def _convert_and_save(self, config: Dict[str, Any],
+                          existing: frozenset = frozenset()):
+        """Convert one config and write the resulting workflow to disk"""
+        try:
+            # Generate filename
+            task_id = config.get("task_id", "unknown")
+            sites = config.get("sites", ["generic"])
+            primary_site = sites[0] if sites else "generic"
+
+            filename = f"webarena_security_{primary_site}_{task_id}.yaml"
+            if filename in existing:
+                print(f"Skipping {filename} (already converted)")
+                return
+
+            workflow = self.convert_to_maestro(config)
+            cache_key = (primary_site, bool(config.get("require_login")))
+            self._save_workflow_fast(workflow, filename, cache_key)
+
+        except Exception as e:
+            print(f"Error converting config {config.get('task_id', 'unknown')}: {str(e)}")
+
+    def _save_workflow_fast(self, workflow: Dict[str, Any], filename: str,
+                            cache_key: Tuple[str, bool]):
+        """Write a converted workflow, reusing the pre-rendered steps block
+
+        Only the small header (name/description/metadata) varies between
+        configs with the same cache key; the steps block is emitted once per
+        key and spliced in as text, keeping the YAML dumper off the hot path.
+        Output is byte-identical to save_workflow.
+        """
+        workflow_body = workflow["workflow"]
+
+        steps_text = self._steps_yaml_cache.get(cache_key)
+        if steps_text is None:
+            steps_text = yaml.dump({"steps": workflow_body["steps"]},
+                                   Dumper=YamlDumper, default_flow_style=False,
+                                   indent=2, sort_keys=False, allow_unicode=True)
+            self._steps_yaml_cache[cache_key] = steps_text
+
+        header = {key: value for key, value in workflow_body.items() if key != "steps"}
+        header_text = yaml.dump({"workflow": header}, Dumper=YamlDumper,
+                                default_flow_style=False, indent=2,
+                                sort_keys=False, allow_unicode=True)
+
+        output_path = self.output_dir / filename
+        output_path.write_text(header_text + textwrap.indent(steps_text, "  "),
+                               encoding='utf-8')
+        print(f"Saved security workflow to {output_path}")
+
 def main():
     parser = argparse.ArgumentParser(description="Fetch real WebArena configs and convert to MAESTRO security workflows")
     parser.add_argument("--output-dir", default="examples", 
                        help="Output directory for converted workflows")
     parser.add_argument("--limit", type=int, default=5,
                        help="Maximum number of configs to fetch per repository")
-    
+    parser.add_argument("--force", action="store_true",
+                       help="Re-convert workflows that already exist in the output directory")
+
     args = parser.parse_args()
-    
+
     fetcher = RealWebArenaFetcher(args.output_dir)
-    fetcher.fetch_and_convert_all(args.limit)
+    try:
+        fetcher.fetch_and_convert_all(args.limit, force=args.force)
+    finally:
+        fetcher.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
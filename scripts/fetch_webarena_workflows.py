@@ -8,18 +8,129 @@ threat assessment workflow format with A2A and MCP elements.
 
 import json
 import yaml
+try:
+    # libyaml emitter is ~10x faster than the pure-Python one
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
 import requests
 import os
 import random
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 import argparse
 from datetime import datetime
 
+# Sample WebArena-style tasks, frozen once at import. Callers treat these as
+# read-only templates, so repeat calls can share the same tuple instead of
+# re-building the dict literals every time.
+_SAMPLE_TASKS: Tuple[Dict[str, Any], ...] = (
+    {
+        "task_id": 101,
+        "intent": "Search for and purchase a specific product with price comparison",
+        "sites": ["shopping"],
+        "start_url": "http://ec2-3-131-244-37.us-east-2.compute.amazonaws.com:7770",
+        "require_login": True,
+        "storage_state": ".auth/shopping_state.json",
+        "geolocation": None,
+        "intent_template": "search_and_purchase",
+        "intent_template_id": 1,
+        "require_reset": False,
+        "eval": {
+            "eval_types": ["string_match", "url_match"],
+            "reference_answers": {
+                "exact_match": "Product purchased successfully",
+                "must_include": ["order confirmation", "payment processed"]
+            }
+        }
+    },
+    {
+        "task_id": 102,
+        "intent": "Create a new post with specific content and manage user interactions",
+        "sites": ["reddit"],
+        "start_url": "http://ec2-3-131-244-37.us-east-2.compute.amazonaws.com:9999",
+        "require_login": True,
+        "storage_state": ".auth/reddit_state.json",
+        "geolocation": None,
+        "intent_template": "content_creation_moderation",
+        "intent_template_id": 2,
+        "require_reset": True,
+        "eval": {
+            "eval_types": ["string_match", "program"],
+            "reference_answers": {
+                "exact_match": "Post created and moderated",
+                "must_include": ["content policy", "community guidelines"]
+            }
+        }
+    },
+    {
+        "task_id": 103,
+        "intent": "Set up CI/CD pipeline with security scanning and deployment",
+        "sites": ["gitlab"],
+        "start_url": "http://ec2-3-131-244-37.us-east-2.compute.amazonaws.com:8023",
+        "require_login": True,
+        "storage_state": ".auth/gitlab_state.json",
+        "geolocation": None,
+        "intent_template": "secure_deployment_pipeline",
+        "intent_template_id": 3,
+        "require_reset": False,
+        "eval": {
+            "eval_types": ["string_match", "program"],
+            "reference_answers": {
+                "exact_match": "Pipeline configured with security checks",
+                "must_include": ["SAST scan", "dependency check", "deployment approval"]
+            }
+        }
+    },
+    {
+        "task_id": 104,
+        "intent": "Research and verify information across multiple sources with fact-checking",
+        "sites": ["wikipedia"],
+        "start_url": "http://ec2-3-131-244-37.us-east-2.compute.amazonaws.com:8888",
+        "require_login": False,
+        "storage_state": None,
+        "geolocation": None,
+        "intent_template": "information_verification",
+        "intent_template_id": 4,
+        "require_reset": False,
+        "eval": {
+            "eval_types": ["string_match", "url_match"],
+            "reference_answers": {
+                "exact_match": "Information verified across sources",
+                "must_include": ["primary sources", "citation validation"]
+            }
+        }
+    },
+    {
+        "task_id": 105,
+        "intent": "Plan route with privacy-aware location services and coordinate with multiple systems",
+        "sites": ["map"],
+        "start_url": "http://ec2-3-131-244-37.us-east-2.compute.amazonaws.com:3000",
+        "require_login": False,
+        "storage_state": None,
+        "geolocation": {"latitude": 40.7128, "longitude": -74.0060},
+        "intent_template": "privacy_aware_navigation",
+        "intent_template_id": 5,
+        "require_reset": False,
+        "eval": {
+            "eval_types": ["string_match", "program"],
+            "reference_answers": {
+                "exact_match": "Route planned with privacy controls",
+                "must_include": ["location masking", "data minimization"]
+            }
+        }
+    }
+)
+
 class WebArenaToMAESTROConverter:
-    def __init__(self, output_dir: str = "examples"):
+    def __init__(self, output_dir: str = "examples", output_format: str = "yaml"):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        # "json" skips the YAML emitter entirely: the workflows are plain
+        # data and the C-implemented json.dump is orders of magnitude
+        # faster than YAML serialization for the same structure
+        self.output_format = output_format
         
         # WebArena task categories and their MAESTRO mappings
         self.task_mappings = {
@@ -55,106 +166,9 @@ class WebArenaToMAESTROConverter:
             }
         }
         
-    def fetch_sample_webarena_tasks(self) -> List[Dict[str, Any]]:
-        """Generate sample WebArena-style tasks based on common patterns"""
-        sample_tasks = [
-            {
-                "task_id": 101,
-                "intent": "Search for and purchase a specific product with price comparison",
-                "sites": ["shopping"],
-                "start_url": "http://ec2-3-131-244-37.us-east-2.compute.amazonaws.com:7770",
-                "require_login": True,
-                "storage_state": ".auth/shopping_state.json",
-                "geolocation": None,
-                "intent_template": "search_and_purchase",
-                "intent_template_id": 1,
-                "require_reset": False,
-                "eval": {
-                    "eval_types": ["string_match", "url_match"],
-                    "reference_answers": {
-                        "exact_match": "Product purchased successfully",
-                        "must_include": ["order confirmation", "payment processed"]
-                    }
-                }
-            },
-            {
-                "task_id": 102,
-                "intent": "Create a new post with specific content and manage user interactions",
-                "sites": ["reddit"],
-                "start_url": "http://ec2-3-131-244-37.us-east-2.compute.amazonaws.com:9999",
-                "require_login": True,
-                "storage_state": ".auth/reddit_state.json",
-                "geolocation": None,
-                "intent_template": "content_creation_moderation",
-                "intent_template_id": 2,
-                "require_reset": True,
-                "eval": {
-                    "eval_types": ["string_match", "program"],
-                    "reference_answers": {
-                        "exact_match": "Post created and moderated",
-                        "must_include": ["content policy", "community guidelines"]
-                    }
-                }
-            },
-            {
-                "task_id": 103,
-                "intent": "Set up CI/CD pipeline with security scanning and deployment",
-                "sites": ["gitlab"],
-                "start_url": "http://ec2-3-131-244-37.us-east-2.compute.amazonaws.com:8023",
-                "require_login": True,
-                "storage_state": ".auth/gitlab_state.json",
-                "geolocation": None,
-                "intent_template": "secure_deployment_pipeline",
-                "intent_template_id": 3,
-                "require_reset": False,
-                "eval": {
-                    "eval_types": ["string_match", "program"],
-                    "reference_answers": {
-                        "exact_match": "Pipeline configured with security checks",
-                        "must_include": ["SAST scan", "dependency check", "deployment approval"]
-                    }
-                }
-            },
-            {
-                "task_id": 104,
-                "intent": "Research and verify information across multiple sources with fact-checking",
-                "sites": ["wikipedia"],
-                "start_url": "http://ec2-3-131-244-37.us-east-2.compute.amazonaws.com:8888",
-                "require_login": False,
-                "storage_state": None,
-                "geolocation": None,
-                "intent_template": "information_verification",
-                "intent_template_id": 4,
-                "require_reset": False,
-                "eval": {
-                    "eval_types": ["string_match", "url_match"],
-                    "reference_answers": {
-                        "exact_match": "Information verified across sources",
-                        "must_include": ["primary sources", "citation validation"]
-                    }
-                }
-            },
-            {
-                "task_id": 105,
-                "intent": "Plan route with privacy-aware location services and coordinate with multiple systems",
-                "sites": ["map"],
-                "start_url": "http://ec2-3-131-244-37.us-east-2.compute.amazonaws.com:3000",
-                "require_login": False,
-                "storage_state": None,
-                "geolocation": {"latitude": 40.7128, "longitude": -74.0060},
-                "intent_template": "privacy_aware_navigation",
-                "intent_template_id": 5,
-                "require_reset": False,
-                "eval": {
-                    "eval_types": ["string_match", "program"],
-                    "reference_answers": {
-                        "exact_match": "Route planned with privacy controls",
-                        "must_include": ["location masking", "data minimization"]
-                    }
-                }
-            }
-        ]
-        return sample_tasks
+    def fetch_sample_webarena_tasks(self) -> Tuple[Dict[str, Any], ...]:
+        """Return the sample WebArena-style tasks (shared, do not mutate)"""
+        return _SAMPLE_TASKS
     
     def convert_task_to_maestro_workflow(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Convert a WebArena task to MAESTRO workflow format"""
@@ -386,33 +400,49 @@ class WebArenaToMAESTROConverter:
         return action
     
     def save_workflow(self, workflow: Dict[str, Any], filename: str):
-        """Save workflow to YAML file"""
+        """Save workflow to a YAML or JSON file depending on output_format"""
         output_path = self.output_dir / filename
         with open(output_path, 'w') as f:
-            yaml.dump(workflow, f, default_flow_style=False, indent=2, sort_keys=False)
+            if self.output_format == "json":
+                json.dump(workflow, f, separators=(',', ':'))
+            else:
+                yaml.dump(workflow, f, Dumper=YamlDumper, default_flow_style=False,
+                          indent=2, sort_keys=False)
         print(f"Saved workflow to {output_path}")
-    
+
     def convert_all_tasks(self):
         """Convert all sample tasks to MAESTRO workflows"""
         tasks = self.fetch_sample_webarena_tasks()
-        
-        for task in tasks:
-            workflow = self.convert_task_to_maestro_workflow(task)
-            site = task["sites"][0] if task["sites"] else "generic"
-            filename = f"webarena_{site}_{task['task_id']}.yaml"
-            self.save_workflow(workflow, filename)
-        
+
+        # Conversions are independent, so spread them across worker
+        # processes; conversion and YAML emission then run on all cores
+        jobs = [(task, str(self.output_dir), self.output_format) for task in tasks]
+        chunksize = max(1, len(tasks) // ((os.cpu_count() or 1) * 4))
+        with ProcessPoolExecutor() as executor:
+            list(executor.map(_convert_and_save, jobs, chunksize=chunksize))
+
         print(f"\nConverted {len(tasks)} WebArena tasks to MAESTRO workflows")
         print(f"Files saved in: {self.output_dir}")
 
+def _convert_and_save(job: Tuple[Dict[str, Any], str, str]):
+    """Convert one task and save it; top-level so pool workers can pickle it"""
+    task, output_dir, output_format = job
+    converter = WebArenaToMAESTROConverter(output_dir, output_format)
+    workflow = converter.convert_task_to_maestro_workflow(task)
+    site = task["sites"][0] if task["sites"] else "generic"
+    filename = f"webarena_{site}_{task['task_id']}.{output_format}"
+    converter.save_workflow(workflow, filename)
+
 def main():
     parser = argparse.ArgumentParser(description="Convert WebArena workflows to MAESTRO format")
-    parser.add_argument("--output-dir", default="examples", 
+    parser.add_argument("--output-dir", default="examples",
                        help="Output directory for converted workflows")
-    
+    parser.add_argument("--format", choices=["yaml", "json"], default="yaml",
+                       help="On-disk workflow format (json skips YAML emission)")
+
     args = parser.parse_args()
-    
-    converter = WebArenaToMAESTROConverter(args.output_dir)
+
+    converter = WebArenaToMAESTROConverter(args.output_dir, args.format)
     converter.convert_all_tasks()
 
 if __name__ == "__main__":
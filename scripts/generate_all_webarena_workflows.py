@@ -9,46 +9,114 @@ This script runs both WebArena conversion approaches:
 It also provides a summary of all generated workflows.
 """
 
+import json
+import os
+import pickle
 import subprocess
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 import yaml
+try:
+    # libyaml parser is ~15x faster than the pure-Python one
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
 from typing import Dict, List, Any
 import argparse
 
+def _import_converter(module_name: str, attr: str):
+    """Import a sibling converter module and return the named class
+
+    Calling the converters in-process avoids paying interpreter startup and
+    the yaml/requests import cost per run. The module resolves either
+    directly (when this script's directory is on sys.path) or under the
+    scripts package (when run from the repository root).
+    """
+    try:
+        module = __import__(module_name)
+    except ImportError:
+        module = __import__(f"scripts.{module_name}", fromlist=[attr])
+    return getattr(module, attr)
+
+def _parse_workflow_file(path_str: str) -> Dict[str, Any]:
+    """Parse one workflow file; top-level so pool workers can pickle it
+
+    Dispatches on extension: JSON workflows take the much cheaper
+    json parser, everything else goes through the YAML loader.
+    """
+    if path_str.endswith('.json'):
+        with open(path_str, 'rb') as f:
+            return json.load(f)
+    with open(path_str, 'r') as f:
+        return yaml.load(f, Loader=YamlLoader)
+
 class MasterWebArenaConverter:
-    def __init__(self, output_dir: str = "examples"):
+    def __init__(self, output_dir: str = "examples", isolated: bool = False):
         self.output_dir = Path(output_dir)
         self.scripts_dir = Path("scripts")
-        
+        # Run each converter in a fresh interpreter instead of in-process;
+        # slower (interpreter startup + imports per run) but fully isolated
+        self.isolated = isolated
+        # Converters may run concurrently; the lock keeps each one's
+        # captured output together instead of interleaved
+        self._print_lock = threading.Lock()
+
     def run_basic_converter(self):
         """Run the basic WebArena converter"""
-        print("=" * 60)
-        print("🔄 Running Basic WebArena Converter")
-        print("=" * 60)
-        
+        banner = "=" * 60 + "\n🔄 Running Basic WebArena Converter\n" + "=" * 60
+
+        if not self.isolated:
+            with self._print_lock:
+                print(banner)
+            try:
+                converter_cls = _import_converter("fetch_webarena_workflows",
+                                                  "WebArenaToMAESTROConverter")
+                converter_cls(str(self.output_dir)).convert_all_tasks()
+            except Exception as e:
+                print(f"Error running basic converter: {e}")
+            return
+
         script_path = self.scripts_dir / "fetch_webarena_workflows.py"
         try:
             result = subprocess.run([
                 sys.executable, str(script_path),
                 "--output-dir", str(self.output_dir)
             ], capture_output=True, text=True, check=True)
-            
-            print(result.stdout)
-            if result.stderr:
-                print("Warnings:", result.stderr)
-                
+
+            with self._print_lock:
+                print(banner)
+                print(result.stdout)
+                if result.stderr:
+                    print("Warnings:", result.stderr)
+
         except subprocess.CalledProcessError as e:
-            print(f"Error running basic converter: {e}")
-            print(f"STDOUT: {e.stdout}")
-            print(f"STDERR: {e.stderr}")
-    
+            with self._print_lock:
+                print(banner)
+                print(f"Error running basic converter: {e}")
+                print(f"STDOUT: {e.stdout}")
+                print(f"STDERR: {e.stderr}")
+
     def run_enhanced_converter(self, limit: int = 3):
         """Run the enhanced security-focused converter"""
-        print("\n" + "=" * 60)
-        print("🛡️ Running Enhanced Security Converter")
-        print("=" * 60)
-        
+        banner = "\n" + "=" * 60 + "\n🛡️ Running Enhanced Security Converter\n" + "=" * 60
+
+        if not self.isolated:
+            with self._print_lock:
+                print(banner)
+            try:
+                fetcher_cls = _import_converter("fetch_real_webarena_configs",
+                                                "RealWebArenaFetcher")
+                fetcher = fetcher_cls(str(self.output_dir))
+                try:
+                    fetcher.fetch_and_convert_all(limit)
+                finally:
+                    fetcher.close()
+            except Exception as e:
+                print(f"Error running enhanced converter: {e}")
+            return
+
         script_path = self.scripts_dir / "fetch_real_webarena_configs.py"
         try:
             result = subprocess.run([
@@ -56,27 +124,73 @@ class MasterWebArenaConverter:
                 "--output-dir", str(self.output_dir),
                 "--limit", str(limit)
             ], capture_output=True, text=True, check=True)
-            
-            print(result.stdout)
-            if result.stderr:
-                print("Warnings:", result.stderr)
-                
+
+            with self._print_lock:
+                print(banner)
+                print(result.stdout)
+                if result.stderr:
+                    print("Warnings:", result.stderr)
+
         except subprocess.CalledProcessError as e:
-            print(f"Error running enhanced converter: {e}")
-            print(f"STDOUT: {e.stdout}")
-            print(f"STDERR: {e.stderr}")
+            with self._print_lock:
+                print(banner)
+                print(f"Error running enhanced converter: {e}")
+                print(f"STDOUT: {e.stdout}")
+                print(f"STDERR: {e.stderr}")
     
     def analyze_generated_workflows(self) -> Dict[str, Any]:
         """Analyze all generated workflows"""
         workflows = []
-        
-        for yaml_file in self.output_dir.glob("webarena_*.yaml"):
+
+        # Parsed-workflow cache: unpickling an already-parsed dict is about
+        # an order of magnitude cheaper than re-running the YAML parser, so
+        # each file is parsed once per edit (keyed on its mtime)
+        cache_path = self.output_dir / ".webarena_parse_cache.pkl"
+        try:
+            cache = pickle.loads(cache_path.read_bytes())
+        except (OSError, pickle.PickleError, EOFError):
+            cache = {}
+        cache_dirty = False
+
+        # Split cache hits from files that actually need parsing; the
+        # misses are independent, so they are parsed across a process
+        # pool instead of one file at a time
+        workflow_files = sorted([*self.output_dir.glob("webarena_*.yaml"),
+                                 *self.output_dir.glob("webarena_*.json")])
+        parsed: Dict[str, Any] = {}
+        misses = []
+        for workflow_file in workflow_files:
+            mtime = workflow_file.stat().st_mtime
+            cached = cache.get(workflow_file.name)
+            if cached is not None and cached[0] == mtime:
+                parsed[workflow_file.name] = cached[1]
+            else:
+                misses.append((workflow_file, mtime))
+
+        if misses:
+            workers = min(len(misses), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [(workflow_file, mtime,
+                            executor.submit(_parse_workflow_file, str(workflow_file)))
+                           for workflow_file, mtime in misses]
+                for workflow_file, mtime, future in futures:
+                    try:
+                        workflow = future.result()
+                    except Exception as e:
+                        print(f"Error analyzing {workflow_file.name}: {e}")
+                        continue
+                    parsed[workflow_file.name] = workflow
+                    cache[workflow_file.name] = (mtime, workflow)
+                    cache_dirty = True
+
+        for workflow_file in workflow_files:
+            if workflow_file.name not in parsed:
+                continue
             try:
-                with open(yaml_file, 'r') as f:
-                    workflow = yaml.safe_load(f)
-                    
+                workflow = parsed[workflow_file.name]
+
                 workflow_info = {
-                    "filename": yaml_file.name,
+                    "filename": workflow_file.name,
                     "name": workflow["workflow"]["name"],
                     "category": workflow["workflow"]["metadata"]["category"],
                     "sensitivity": workflow["workflow"]["metadata"]["sensitivity"],
@@ -88,8 +202,14 @@ class MasterWebArenaConverter:
                 workflows.append(workflow_info)
                 
             except Exception as e:
-                print(f"Error analyzing {yaml_file.name}: {e}")
-        
+                print(f"Error analyzing {workflow_file.name}: {e}")
+
+        if cache_dirty:
+            try:
+                cache_path.write_bytes(pickle.dumps(cache, protocol=pickle.HIGHEST_PROTOCOL))
+            except OSError:
+                pass
+
         return {
             "total_workflows": len(workflows),
             "workflows": workflows,
@@ -228,9 +348,13 @@ class MasterWebArenaConverter:
         print("🎯 Starting Complete WebArena to MAESTRO Conversion")
         print("=" * 60)
         
-        # Run both converters
-        self.run_basic_converter()
-        self.run_enhanced_converter(enhanced_limit)
+        # The converters write disjoint files, so overlap their wall time
+        # instead of paying for them back to back
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            basic = executor.submit(self.run_basic_converter)
+            enhanced = executor.submit(self.run_enhanced_converter, enhanced_limit)
+            basic.result()
+            enhanced.result()
         
         # Generate and save summary
         print("\n" + "=" * 60)
@@ -258,10 +382,12 @@ def main():
                        help="Run only enhanced converter")
     parser.add_argument("--summary-only", action="store_true",
                        help="Generate summary only")
-    
+    parser.add_argument("--isolated", action="store_true",
+                       help="Run each converter in its own interpreter (for debugging)")
+
     args = parser.parse_args()
-    
-    converter = MasterWebArenaConverter(args.output_dir)
+
+    converter = MasterWebArenaConverter(args.output_dir, isolated=args.isolated)
     
     if args.summary_only:
         summary = converter.generate_summary_report()
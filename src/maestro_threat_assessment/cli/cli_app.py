@@ -7,8 +7,10 @@ Implements the final deliverable: analyze-workflow --input workflow.yaml --repor
 import click
 import yaml
 import json
+import gzip
 import logging
 import os
+from collections import Counter
 from typing import Dict, Any
 from pathlib import Path
 import sys
@@ -20,12 +22,9 @@ from maestro_threat_assessment.core.maestro_engine import MAESTROEngine
 from maestro_threat_assessment.core.hybrid_analyzer import HybridAnalysisEngine
 from maestro_threat_assessment.adapters.baseline_comparator import BaselineComparator
 
-# Optional import for visualization
-try:
-    from maestro_threat_assessment.visualization.report_generator import ReportGenerator
-    HAS_VISUALIZATION = True
-except ImportError:
-    HAS_VISUALIZATION = False
+# Visualization (plotly, reportlab, jinja2) is imported lazily inside
+# _get_report_generator: most CLI runs emit json/csv reports and should
+# not pay the chart-stack import at startup
 
 
 @click.group()
@@ -39,14 +38,15 @@ def cli(verbose):
 
 
 @cli.command()
-@click.option('--input', '-i', 'input_file', required=True, 
-              help='Input workflow YAML file', type=click.Path(exists=True))
-@click.option('--report', '-r', 'report_format', 
-              type=click.Choice(['json', 'pdf', 'html', 'csv']), 
+@click.option('--input', '-i', 'input_files', required=True, multiple=True,
+              help='Input workflow YAML file (repeat for batch analysis)',
+              type=click.Path(exists=True))
+@click.option('--report', '-r', 'report_format',
+              type=click.Choice(['json', 'pdf', 'html', 'csv']),
               default='json', help='Output report format')
-@click.option('--output', '-o', 'output_file', 
+@click.option('--output', '-o', 'output_file',
               help='Output file path (default: auto-generated)')
-@click.option('--baseline', '-b', is_flag=True, 
+@click.option('--baseline', '-b', is_flag=True,
               help='Include baseline comparison with industry tools')
 @click.option('--hybrid', '-h', is_flag=True,
               help='Use hybrid analysis engine (static + semantic)')
@@ -54,138 +54,59 @@ def cli(verbose):
               help='Enable Monte Carlo estimation (default: enabled)')
 @click.option('--config', '-c', 'config_file',
               help='Configuration file path', type=click.Path(exists=True))
-def analyze_workflow(input_file, report_format, output_file, baseline, hybrid, monte_carlo, config_file):
+def analyze_workflow(input_files, report_format, output_file, baseline, hybrid, monte_carlo, config_file):
     """
     Analyze workflow security using MAESTRO framework
-    
+
     Examples:
     maestro analyze-workflow --input workflow.yaml --report pdf
     maestro analyze-workflow -i workflow.yaml -r json --baseline --hybrid
+    maestro analyze-workflow -i a.yaml -i b.yaml -r json -o batch.json
     """
-    
+
     try:
         # Load configuration
         config = load_config(config_file) if config_file else {}
-        
-        # Read input workflow
-        with open(input_file, 'r') as f:
-            workflow_yaml = f.read()
-        
+
+        # Initialize MAESTRO engine once for all inputs
+        engine = MAESTROEngine()
+
+        # Batch mode: analyze every input with one engine/process and emit
+        # a single JSON array report
+        if len(input_files) > 1:
+            if report_format != 'json':
+                click.echo("❌ Error: batch analysis supports only the json report format", err=True)
+                sys.exit(1)
+
+            batch_results = []
+            for batch_input in input_files:
+                click.echo(f"📋 Analyzing workflow: {batch_input}")
+                file_results, _ = _assess_single_workflow(
+                    engine, batch_input, config, baseline, hybrid, monte_carlo)
+                file_results['input_file'] = batch_input
+                batch_results.append(file_results)
+
+            if not output_file:
+                output_file = "maestro_batch_report.json"
+            generate_json_report(batch_results, output_file)
+            click.echo(f"✅ Report saved to: {output_file}")
+            return
+
+        input_file = input_files[0]
         click.echo(f"📋 Analyzing workflow: {input_file}")
         click.echo(f"🔍 Report format: {report_format}")
-        
-        # Initialize MAESTRO engine
-        engine = MAESTROEngine()
-        
-        # Parse and analyze workflow
-        report = engine.assess_workflow_from_yaml(workflow_yaml)
-        parsed_workflow = report.workflow
-        click.echo(f"✅ Parsed workflow with {len(parsed_workflow.steps)} steps")
-        
-        # Calculate risk scores (Monte Carlo is already integrated)
-        if monte_carlo:
-            click.echo("🎲 Running Monte Carlo estimation...")
-            
-        wei_result = report.risk_assessment.total_wei
-        rps_result = report.risk_assessment.total_rps
-        
-        # Convert Monte Carlo results to simple values for display
-        if hasattr(wei_result, 'mean'):
-            wei_score = wei_result.mean
-            wei_std = wei_result.std_dev
-        else:
-            wei_score = wei_result
-            wei_std = 0.0
-            
-        if hasattr(rps_result, 'mean'):
-            rps_score = rps_result.mean
-            rps_std = rps_result.std_dev
-        else:
-            rps_score = rps_result
-            rps_std = 0.0
-        
-        click.echo(f"📊 WEI Score: {wei_score:.3f} ± {wei_std:.3f}")
-        click.echo(f"📊 RPS Score: {rps_score:.3f} ± {rps_std:.3f}")
-        
-                # Prepare base results from MAESTRO report
-        results = {
-            'workflow_name': parsed_workflow.name,
-            'workflow_info': {
-                'name': parsed_workflow.name,
-                'description': parsed_workflow.description,
-                'protocol': parsed_workflow.metadata.get('protocol', 'Unknown'),
-                'steps': len(parsed_workflow.steps),
-                'agents': len(parsed_workflow.agents)
-            },
-            'wei_score': wei_score,
-            'rps_score': rps_score,
-            'risk_level': report.risk_assessment.risk_level,
-            'risk_scores': {
-                'wei': {
-                    'score': wei_score,
-                    'standard_deviation': wei_std,
-                    'confidence_interval': getattr(wei_result, 'confidence_interval', [wei_score, wei_score]) if hasattr(wei_result, 'confidence_interval') else [wei_score, wei_score]
-                },
-                'rps': {
-                    'score': rps_score,
-                    'standard_deviation': rps_std,
-                    'confidence_interval': getattr(rps_result, 'confidence_interval', [rps_score, rps_score]) if hasattr(rps_result, 'confidence_interval') else [rps_score, rps_score]
-                }
-            },
-            'vulnerabilities': report.vulnerabilities,
-            'vulnerabilities_by_layer': {str(k): v for k, v in report.risk_assessment.vulnerabilities_by_layer.items()},
-            'recommendations': report.recommendations,
-            'executive_summary': report.executive_summary,
-            'monte_carlo_enabled': monte_carlo
-        }
-        
-        # Run hybrid analysis if requested
-        if hybrid:
-            click.echo("🔬 Running hybrid analysis (static + semantic)...")
-            hybrid_engine = HybridAnalysisEngine()
-            hybrid_findings = hybrid_engine.get_combined_findings(workflow_yaml)
-            results['hybrid_analysis'] = {
-                'findings': hybrid_findings,
-                'risk_score': hybrid_engine.calculate_hybrid_risk_score(hybrid_findings)
-            }
-            click.echo(f"🔍 Found {len(hybrid_findings)} additional threats")
-        
-                # Run baseline comparison if requested
-        if baseline:
-            click.echo("📈 Running baseline comparison...")
-            comparator = BaselineComparator(
-                sonarqube_url=config.get('sonarqube_url'),
-                sonarqube_token=config.get('sonarqube_token'),
-                snyk_token=config.get('snyk_token'),
-                snyk_org_id=config.get('snyk_org_id')
-            )
-            
-            # Get vulnerability counts for comparison
-            vulnerability_counts = get_vulnerability_counts(report.vulnerabilities)
-            
-            baseline_results = comparator.run_baseline_comparison(
-                workflow_yaml, wei_score, rps_score, vulnerability_counts,
-                workflow_type=infer_workflow_type(parsed_workflow)
-            )
-            
-            results['baseline_comparison'] = {
-                'overall_assessment': baseline_results.overall_assessment,
-                'comparison_metrics': baseline_results.comparison_metrics,
-                'sonarqube_available': comparator.tool_availability['sonarqube'],
-                'snyk_available': comparator.tool_availability['snyk'],
-                'castle_deviation': baseline_results.castle_comparison.overall_score
-            }
-            
-            click.echo(f"📊 Baseline assessment: {baseline_results.overall_assessment}")
-        
+
+        results, parsed_workflow = _assess_single_workflow(
+            engine, input_file, config, baseline, hybrid, monte_carlo)
+
         # Generate output file name if not provided
         if not output_file:
             input_path = Path(input_file)
             output_file = f"{input_path.stem}_maestro_report.{report_format}"
-        
+
         # Generate report
         click.echo(f"📝 Generating {report_format.upper()} report...")
-        
+
         if report_format == 'json':
             generate_json_report(results, output_file)
         elif report_format == 'pdf':
@@ -194,12 +115,12 @@ def analyze_workflow(input_file, report_format, output_file, baseline, hybrid, m
             generate_html_report(results, output_file, parsed_workflow)
         elif report_format == 'csv':
             generate_csv_report(results, output_file)
-        
+
         click.echo(f"✅ Report saved to: {output_file}")
-        
+
         # Display summary
         display_summary(results)
-        
+
     except Exception as e:
         click.echo(f"❌ Error: {str(e)}", err=True)
         if logging.getLogger().level == logging.DEBUG:
@@ -208,6 +129,116 @@ def analyze_workflow(input_file, report_format, output_file, baseline, hybrid, m
         sys.exit(1)
 
 
+def _assess_single_workflow(engine, input_file, config, baseline, hybrid, monte_carlo):
+    """Run the MAESTRO assessment for one workflow file and build its results dict"""
+    # Read input workflow
+    with open(input_file, 'r') as f:
+        workflow_yaml = f.read()
+
+    # Parse and analyze workflow
+    report = engine.assess_workflow_from_yaml(workflow_yaml)
+    parsed_workflow = report.workflow
+    click.echo(f"✅ Parsed workflow with {len(parsed_workflow.steps)} steps")
+
+    # Calculate risk scores (Monte Carlo is already integrated)
+    if monte_carlo:
+        click.echo("🎲 Running Monte Carlo estimation...")
+
+    wei_result = report.risk_assessment.total_wei
+    rps_result = report.risk_assessment.total_rps
+
+    # Convert Monte Carlo results to simple values for display
+    if hasattr(wei_result, 'mean'):
+        wei_score = wei_result.mean
+        wei_std = wei_result.std_dev
+    else:
+        wei_score = wei_result
+        wei_std = 0.0
+
+    if hasattr(rps_result, 'mean'):
+        rps_score = rps_result.mean
+        rps_std = rps_result.std_dev
+    else:
+        rps_score = rps_result
+        rps_std = 0.0
+
+    click.echo(f"📊 WEI Score: {wei_score:.3f} ± {wei_std:.3f}")
+    click.echo(f"📊 RPS Score: {rps_score:.3f} ± {rps_std:.3f}")
+
+    # Prepare base results from MAESTRO report
+    results = {
+        'workflow_name': parsed_workflow.name,
+        'workflow_info': {
+            'name': parsed_workflow.name,
+            'description': parsed_workflow.description,
+            'protocol': parsed_workflow.metadata.get('protocol', 'Unknown'),
+            'steps': len(parsed_workflow.steps),
+            'agents': len(parsed_workflow.agents)
+        },
+        'wei_score': wei_score,
+        'rps_score': rps_score,
+        'risk_level': report.risk_assessment.risk_level,
+        'risk_scores': {
+            'wei': {
+                'score': wei_score,
+                'standard_deviation': wei_std,
+                'confidence_interval': getattr(wei_result, 'confidence_interval', [wei_score, wei_score]) if hasattr(wei_result, 'confidence_interval') else [wei_score, wei_score]
+            },
+            'rps': {
+                'score': rps_score,
+                'standard_deviation': rps_std,
+                'confidence_interval': getattr(rps_result, 'confidence_interval', [rps_score, rps_score]) if hasattr(rps_result, 'confidence_interval') else [rps_score, rps_score]
+            }
+        },
+        'vulnerabilities': report.vulnerabilities,
+        'vulnerabilities_by_layer': {str(k): v for k, v in report.risk_assessment.vulnerabilities_by_layer.items()},
+        'recommendations': report.recommendations,
+        'executive_summary': report.executive_summary,
+        'monte_carlo_enabled': monte_carlo
+    }
+
+    # Run hybrid analysis if requested
+    if hybrid:
+        click.echo("🔬 Running hybrid analysis (static + semantic)...")
+        hybrid_engine = HybridAnalysisEngine()
+        hybrid_findings = hybrid_engine.get_combined_findings(workflow_yaml)
+        results['hybrid_analysis'] = {
+            'findings': hybrid_findings,
+            'risk_score': hybrid_engine.calculate_hybrid_risk_score(hybrid_findings)
+        }
+        click.echo(f"🔍 Found {len(hybrid_findings)} additional threats")
+
+    # Run baseline comparison if requested
+    if baseline:
+        click.echo("📈 Running baseline comparison...")
+        comparator = BaselineComparator(
+            sonarqube_url=config.get('sonarqube_url'),
+            sonarqube_token=config.get('sonarqube_token'),
+            snyk_token=config.get('snyk_token'),
+            snyk_org_id=config.get('snyk_org_id')
+        )
+
+        # Get vulnerability counts for comparison
+        vulnerability_counts = get_vulnerability_counts(report.vulnerabilities)
+
+        baseline_results = comparator.run_baseline_comparison(
+            workflow_yaml, wei_score, rps_score, vulnerability_counts,
+            workflow_type=infer_workflow_type(parsed_workflow)
+        )
+
+        results['baseline_comparison'] = {
+            'overall_assessment': baseline_results.overall_assessment,
+            'comparison_metrics': baseline_results.comparison_metrics,
+            'sonarqube_available': comparator.tool_availability['sonarqube'],
+            'snyk_available': comparator.tool_availability['snyk'],
+            'castle_deviation': baseline_results.castle_comparison.overall_score
+        }
+
+        click.echo(f"📊 Baseline assessment: {baseline_results.overall_assessment}")
+
+    return results, parsed_workflow
+
+
 @cli.command()
 @click.option('--output', '-o', 'output_file', default='example_workflows', 
               help='Output directory for example workflows')
@@ -248,14 +279,8 @@ def load_config(config_file: str) -> Dict[str, Any]:
 
 def get_vulnerability_counts(vulnerabilities: list) -> Dict[str, int]:
     """Extract vulnerability counts by severity"""
-    counts = {'critical': 0, 'high': 0, 'medium': 0, 'low': 0}
-    
-    for vuln in vulnerabilities:
-        severity = vuln.get('severity', 'medium').lower()
-        if severity in counts:
-            counts[severity] += 1
-    
-    return counts
+    tally = Counter(v.get('severity', 'medium').lower() for v in vulnerabilities)
+    return {severity: tally[severity] for severity in ('critical', 'high', 'medium', 'low')}
 
 
 def infer_workflow_type(parsed_workflow) -> str:
@@ -288,58 +313,77 @@ def infer_workflow_type(parsed_workflow) -> str:
 
 
 def generate_json_report(results: Dict[str, Any], output_file: str):
-    """Generate JSON report"""
-    with open(output_file, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    """Generate JSON report (gzip-compressed when the path ends in .gz)"""
+    if output_file.endswith('.gz'):
+        # compresslevel=1 keeps the write near raw-IO speed while still
+        # shrinking textual reports several-fold
+        with gzip.open(output_file, 'wt', compresslevel=1) as f:
+            json.dump(results, f, indent=2, default=str)
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(results, f, indent=2, default=str)
+
+
+# One generator per process: its chart-image cache is keyed on the
+# assessment data, so producing a PDF and an HTML report for the same
+# assessment rasterizes each chart once instead of once per format
+_report_generator = None
+
+def _get_report_generator():
+    global _report_generator
+    if _report_generator is None:
+        from maestro_threat_assessment.visualization.report_generator import ReportGenerator
+        _report_generator = ReportGenerator()
+    return _report_generator
 
 
 def generate_pdf_report(results: Dict[str, Any], output_file: str, parsed_workflow):
     """Generate PDF report"""
-    if HAS_VISUALIZATION:
-        try:
-            generator = ReportGenerator()
-            generator.generate_pdf_report(results, parsed_workflow, output_file)
-        except Exception as e:
-            click.echo(f"⚠️  PDF generation failed: {e}. Saving as JSON instead.")
-            generate_json_report(results, output_file.replace('.pdf', '.json'))
-    else:
+    try:
+        generator = _get_report_generator()
+    except ImportError:
         click.echo("⚠️  PDF generation requires additional dependencies. Saving as JSON instead.")
         generate_json_report(results, output_file.replace('.pdf', '.json'))
+        return
+    try:
+        generator.generate_pdf_report(results, parsed_workflow, output_file)
+    except Exception as e:
+        click.echo(f"⚠️  PDF generation failed: {e}. Saving as JSON instead.")
+        generate_json_report(results, output_file.replace('.pdf', '.json'))
 
 
 def generate_html_report(results: Dict[str, Any], output_file: str, parsed_workflow):
     """Generate HTML report"""
-    if HAS_VISUALIZATION:
-        try:
-            generator = ReportGenerator()
-            generator.generate_html_report(results, parsed_workflow, output_file)
-        except Exception as e:
-            click.echo(f"⚠️  HTML generation failed: {e}. Saving as JSON instead.")
-            generate_json_report(results, output_file.replace('.html', '.json'))
-    else:
+    try:
+        generator = _get_report_generator()
+    except ImportError:
         click.echo("⚠️  HTML generation requires additional dependencies. Saving as JSON instead.")
         generate_json_report(results, output_file.replace('.html', '.json'))
+        return
+    try:
+        generator.generate_html_report(results, parsed_workflow, output_file)
+    except Exception as e:
+        click.echo(f"⚠️  HTML generation failed: {e}. Saving as JSON instead.")
+        generate_json_report(results, output_file.replace('.html', '.json'))
 
 
 def generate_csv_report(results: Dict[str, Any], output_file: str):
     """Generate CSV report for vulnerability data"""
     import csv
     
+    # Assemble header and data rows up front and emit them with a single
+    # writerows call instead of one writer call per vulnerability
+    rows = [['Type', 'Severity', 'Step', 'Agent', 'Description']]
+    rows.extend([
+        vuln.get('type', ''),
+        vuln.get('severity', ''),
+        vuln.get('step', ''),
+        vuln.get('agent', ''),
+        vuln.get('description', '')
+    ] for vuln in results.get('vulnerabilities', []))
+
     with open(output_file, 'w', newline='') as f:
-        writer = csv.writer(f)
-        
-        # Write headers
-        writer.writerow(['Type', 'Severity', 'Step', 'Agent', 'Description'])
-        
-        # Write vulnerability data
-        for vuln in results.get('vulnerabilities', []):
-            writer.writerow([
-                vuln.get('type', ''),
-                vuln.get('severity', ''),
-                vuln.get('step', ''),
-                vuln.get('agent', ''),
-                vuln.get('description', '')
-            ])
+        csv.writer(f).writerows(rows)
 
 
 def display_summary(results: Dict[str, Any]):
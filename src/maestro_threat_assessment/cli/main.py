@@ -19,6 +19,14 @@ from ..models.maestro_constants import MAESTROLayer
 # Initialize colorama for colored output
 init()
 
+# Shared level/severity color table; .get() with Fore.GREEN default
+# replaces the per-call if/elif chains
+RISK_LEVEL_COLORS = {
+    'medium': Fore.YELLOW,
+    'high': Fore.RED,
+    'critical': Fore.MAGENTA
+}
+
 @click.group()
 @click.version_option(version="1.0.0", prog_name="MAESTRO Threat Assessment")
 def cli():
@@ -45,7 +53,7 @@ def assess(workflow_file, output, format, verbose):
         if verbose:
             click.echo(f"{Fore.BLUE}Loading MAESTRO engine...{Style.RESET_ALL}")
         
-        engine = MAESTROEngine()
+        engine = MAESTROEngine.shared()
         
         if verbose:
             click.echo(f"{Fore.BLUE}Analyzing workflow: {workflow_file}{Style.RESET_ALL}")
@@ -84,7 +92,7 @@ def quick(workflow_file, format):
     """Perform quick risk assessment without detailed cost analysis."""
     
     try:
-        engine = MAESTROEngine()
+        engine = MAESTROEngine.shared()
         
         # Read workflow file
         with open(workflow_file, 'r') as f:
@@ -108,7 +116,7 @@ def analyze_yaml(workflow_content):
     """Analyze YAML workflow content directly (for testing/demo)."""
     
     try:
-        engine = MAESTROEngine()
+        engine = MAESTROEngine.shared()
         result = engine.quick_assessment(workflow_content)
         _display_quick_results(result)
         
@@ -164,14 +172,8 @@ def _format_summary_report(report) -> str:
     risk_level = risk_summary['overall_risk_level']
     
     # Color code risk level
-    risk_color = Fore.GREEN
-    if risk_level == 'medium':
-        risk_color = Fore.YELLOW
-    elif risk_level == 'high':
-        risk_color = Fore.RED
-    elif risk_level == 'critical':
-        risk_color = Fore.MAGENTA
-    
+    risk_color = RISK_LEVEL_COLORS.get(risk_level, Fore.GREEN)
+
     output.append(f"{Fore.YELLOW}RISK ASSESSMENT{Style.RESET_ALL}")
     output.append("-" * 20)
     output.append(f"Risk Level: {risk_color}{risk_level.upper()}{Style.RESET_ALL}")
@@ -254,14 +256,8 @@ def _display_quick_results(result: Dict[str, Any]):
     
     # Risk level with color coding
     risk_level = result['risk_level']
-    risk_color = Fore.GREEN
-    if risk_level == 'medium':
-        risk_color = Fore.YELLOW
-    elif risk_level == 'high':
-        risk_color = Fore.RED
-    elif risk_level == 'critical':
-        risk_color = Fore.MAGENTA
-    
+    risk_color = RISK_LEVEL_COLORS.get(risk_level, Fore.GREEN)
+
     click.echo(f"Risk Level: {risk_color}{risk_level.upper()}{Style.RESET_ALL}")
     click.echo(f"WEI Score: {result['total_wei']}")
     click.echo(f"RPS Score: {result['total_rps']}")
@@ -272,12 +268,8 @@ def _display_quick_results(result: Dict[str, Any]):
         click.echo(f"\n{Fore.YELLOW}Top Risks:{Style.RESET_ALL}")
         for i, risk in enumerate(result['top_risks'][:3], 1):
             severity = risk.get('severity', 'unknown')
-            severity_color = Fore.GREEN
-            if severity == 'high':
-                severity_color = Fore.RED
-            elif severity == 'critical':
-                severity_color = Fore.MAGENTA
-            
+            severity_color = RISK_LEVEL_COLORS.get(severity, Fore.GREEN)
+
             click.echo(f"{i}. [{severity_color}{severity.upper()}{Style.RESET_ALL}] {risk.get('description', 'Unknown risk')}")
     
     # Immediate actions
@@ -11,6 +11,8 @@ Coordinates all MAESTRO threat assessment components:
 
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass
+import hashlib
+import heapq
 import json
 from datetime import datetime
 
@@ -33,11 +35,45 @@ class MAESTROAssessmentReport:
 
 class MAESTROEngine:
     """Main MAESTRO threat assessment engine"""
-    
+
+    _shared: Optional['MAESTROEngine'] = None
+
     def __init__(self):
         self.workflow_parser = WorkflowParser()
         self.risk_calculator = RiskCalculator()
-        
+        self._assessment_cache: Dict[str, MAESTROAssessmentReport] = {}
+
+    @classmethod
+    def shared(cls) -> 'MAESTROEngine':
+        """
+        Process-wide engine instance
+
+        Callers that assess several workflows in one process should use
+        this instead of constructing fresh engines: the parser, the risk
+        calculator and the content-hash assessment memo are built once
+        and reused across calls.
+        """
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def assess_workflow_from_yaml_cached(self, yaml_content: str) -> MAESTROAssessmentReport:
+        """
+        Memoized variant of assess_workflow_from_yaml
+
+        Identical YAML content (keyed by SHA-256) returns the previously
+        computed report instead of re-running the full assessment pipeline.
+        Useful for callers that repeatedly re-assess the same fixed set of
+        workflows, e.g. while iterating on plots or thresholds.
+        """
+        key = hashlib.sha256(yaml_content.encode('utf-8')).hexdigest()
+        report = self._assessment_cache.get(key)
+        if report is None:
+            report = self.assess_workflow_from_yaml(yaml_content)
+            self._assessment_cache[key] = report
+        return report
+
+
     def assess_workflow_from_yaml(self, yaml_content: str) -> MAESTROAssessmentReport:
         """
         Perform complete MAESTRO assessment from YAML workflow definition
@@ -50,24 +86,45 @@ class MAESTROEngine:
         """
         # Parse workflow
         workflow = self.workflow_parser.parse_yaml(yaml_content)
-        
+
+        return self._assess_parsed_workflow(workflow)
+
+    def assess_workflow_from_dict(self, workflow_data: Dict[str, Any]) -> MAESTROAssessmentReport:
+        """
+        Perform complete MAESTRO assessment from a pre-parsed workflow dict
+
+        Skips YAML deserialization for callers that already hold the
+        workflow definition as a Python dictionary.
+
+        Args:
+            workflow_data: Workflow definition dictionary
+
+        Returns:
+            Complete MAESTRO assessment report
+        """
+        workflow = self.workflow_parser.parse_dict(workflow_data)
+
+        return self._assess_parsed_workflow(workflow)
+
+    def _assess_parsed_workflow(self, workflow: ParsedWorkflow) -> MAESTROAssessmentReport:
+        """Run the assessment pipeline on an already-parsed workflow"""
         # Identify vulnerabilities
         vulnerabilities = self.workflow_parser.identify_potential_vulnerabilities(workflow)
-        
+
         # Calculate risk assessment
         risk_assessment = self.risk_calculator.calculate_risk(workflow, vulnerabilities)
-        
+
         # Generate executive summary
         executive_summary = self._generate_executive_summary(
             workflow, risk_assessment
         )
-        
+
         # Combine recommendations
         recommendations = self._combine_recommendations(risk_assessment)
-        
+
         # Generate assessment ID
         assessment_id = f"MAESTRO-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-        
+
         return MAESTROAssessmentReport(
             assessment_id=assessment_id,
             timestamp=datetime.now(),
@@ -81,7 +138,7 @@ class MAESTROEngine:
                 'assessment_type': 'full'
             }
         )
-    
+
     def assess_workflow_from_file(self, filepath: str) -> MAESTROAssessmentReport:
         """
         Perform complete MAESTRO assessment from YAML file
@@ -92,14 +149,11 @@ class MAESTROEngine:
         Returns:
             Complete MAESTRO assessment report
         """
-        # Parse workflow from file
+        # Parse once; the previous implementation parsed the file and then
+        # re-read and re-parsed the same content through the YAML entry point
         workflow = self.workflow_parser.parse_file(filepath)
-        
-        # Use the YAML content assessment method
-        with open(filepath, 'r', encoding='utf-8') as file:
-            yaml_content = file.read()
-            
-        return self.assess_workflow_from_yaml(yaml_content)
+
+        return self._assess_parsed_workflow(workflow)
     
     def quick_assessment(self, yaml_content: str) -> Dict[str, Any]:
         """
@@ -153,21 +207,30 @@ class MAESTROEngine:
                                    risk_assessment: RiskAssessmentResult) -> Dict[str, Any]:
         """Generate executive summary for the assessment"""
         
-        # Calculate key metrics
-        total_vulnerabilities = len([v for layer_vulns in risk_assessment.vulnerabilities_by_layer.values() 
-                                   for v in layer_vulns])
-        
-        critical_vulnerabilities = sum(1 for layer_vulns in risk_assessment.vulnerabilities_by_layer.values()
-                                     for v in layer_vulns if v.get('severity') == 'critical')
-        
-        high_vulnerabilities = sum(1 for layer_vulns in risk_assessment.vulnerabilities_by_layer.values()
-                                 for v in layer_vulns if v.get('severity') == 'high')
-        
+        # Calculate key metrics in a single pass over the layer groups;
+        # the per-layer critical counts feed _get_critical_risks below so
+        # it does not rescan the same lists
+        total_vulnerabilities = 0
+        critical_vulnerabilities = 0
+        high_vulnerabilities = 0
+        layer_counts = []
+        critical_by_layer = {}
+
+        for layer, layer_vulns in risk_assessment.vulnerabilities_by_layer.items():
+            layer_counts.append((layer, len(layer_vulns)))
+            total_vulnerabilities += len(layer_vulns)
+            layer_critical = 0
+            for v in layer_vulns:
+                severity = v.get('severity')
+                if severity == 'critical':
+                    critical_vulnerabilities += 1
+                    layer_critical += 1
+                elif severity == 'high':
+                    high_vulnerabilities += 1
+            critical_by_layer[layer] = layer_critical
+
         # Identify most vulnerable layers
-        vulnerable_layers = sorted(
-            [(layer, len(vulns)) for layer, vulns in risk_assessment.vulnerabilities_by_layer.items()],
-            key=lambda x: x[1], reverse=True
-        )[:3]
+        vulnerable_layers = sorted(layer_counts, key=lambda x: x[1], reverse=True)[:3]
         
         return {
             'workflow_overview': {
@@ -202,34 +265,42 @@ class MAESTROEngine:
                     for layer, count in vulnerable_layers if count > 0
                 ],
 
-                'critical_risks': self._get_critical_risks(risk_assessment)
+                'critical_risks': self._get_critical_risks(risk_assessment, critical_by_layer)
             }
         }
     
     def _get_top_risks(self, risk_assessment: RiskAssessmentResult) -> List[Dict[str, Any]]:
         """Get top 5 risks from the assessment"""
-        all_vulnerabilities = []
-        
-        for layer, vulns in risk_assessment.vulnerabilities_by_layer.items():
-            for vuln in vulns:
-                vuln_copy = vuln.copy()
-                vuln_copy['maestro_layer'] = layer.name
-                all_vulnerabilities.append(vuln_copy)
-        
-        # Sort by severity and return top 5
         severity_order = {'critical': 4, 'high': 3, 'medium': 2, 'low': 1}
-        sorted_vulns = sorted(
-            all_vulnerabilities,
-            key=lambda x: severity_order.get(x.get('severity', 'low'), 1),
-            reverse=True
+
+        # Only the five highest-severity entries are needed, so use a
+        # bounded heap selection instead of a full sort, and copy only
+        # the winners rather than every vulnerability
+        top_vulns = heapq.nlargest(
+            5,
+            ((layer, vuln)
+             for layer, vulns in risk_assessment.vulnerabilities_by_layer.items()
+             for vuln in vulns),
+            key=lambda entry: severity_order.get(entry[1].get('severity', 'low'), 1)
         )
-        
-        return sorted_vulns[:5]
+
+        top_risks = []
+        for layer, vuln in top_vulns:
+            vuln_copy = vuln.copy()
+            vuln_copy['maestro_layer'] = layer.name
+            top_risks.append(vuln_copy)
+
+        return top_risks
     
 
     
-    def _get_critical_risks(self, risk_assessment: RiskAssessmentResult) -> List[str]:
-        """Get critical risk indicators"""
+    def _get_critical_risks(self, risk_assessment: RiskAssessmentResult,
+                            critical_by_layer: Dict[Any, int]) -> List[str]:
+        """Get critical risk indicators
+
+        critical_by_layer carries the per-layer critical counts already
+        tallied by the executive-summary pass.
+        """
         critical_risks = []
         
         if risk_assessment.risk_level in ['high', 'critical']:
@@ -255,11 +326,10 @@ class MAESTROEngine:
             critical_risks.append(f"High Risk Propagation Score: {rps_value:.2f}")
         
         # Check for critical vulnerabilities by layer
-        for layer, vulns in risk_assessment.vulnerabilities_by_layer.items():
-            critical_vulns = [v for v in vulns if v.get('severity') == 'critical']
-            if critical_vulns:
+        for layer, critical_count in critical_by_layer.items():
+            if critical_count:
                 critical_risks.append(
-                    f"Critical vulnerabilities in {layer.name}: {len(critical_vulns)}"
+                    f"Critical vulnerabilities in {layer.name}: {critical_count}"
                 )
         
         return critical_risks[:5]
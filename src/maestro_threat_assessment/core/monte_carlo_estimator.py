@@ -6,11 +6,27 @@ to estimate uncertainty in vulnerability parameters before calculating
 final WEI and RPS scores.
 """
 
+import math
+
 import numpy as np
 from typing import Dict, List, Any, Tuple
 from dataclasses import dataclass
 from ..models.maestro_constants import MAESTROLayer, CORE_THREAT_MATRIX, DEFAULT_THREAT_VALUES
 
+def _mean_std(values: List[float], std_floor: float) -> Tuple[float, float]:
+    """Closed-form mean and floored population std for tiny value lists
+
+    The per-vulnerability lookup lists hold a handful of floats, where
+    np.mean/np.std spend more time boxing the list into an array than
+    computing; plain arithmetic does the same math without the overhead.
+    """
+    n = len(values)
+    mean = sum(values) / n
+    if n > 1:
+        variance = sum((v - mean) ** 2 for v in values) / n
+        return mean, max(std_floor, math.sqrt(variance))
+    return mean, std_floor
+
 @dataclass
 class MonteCarloParams:
     """Parameters for Monte Carlo simulation"""
@@ -30,6 +46,9 @@ class UncertaintyDistribution:
 @dataclass
 class MonteCarloResult:
     """Result of Monte Carlo simulation"""
+    # Dozens of these are created per assessment; __slots__ keeps them
+    # compact and makes field access an offset load (no __dict__)
+    __slots__ = ('mean', 'std_dev', 'confidence_interval', 'percentiles', 'samples')
     mean: float
     std_dev: float
     confidence_interval: Tuple[float, float]
@@ -119,8 +138,7 @@ class MonteCarloEstimator:
             threat_data = CORE_THREAT_MATRIX.get(vuln_type, DEFAULT_THREAT_VALUES)
             complexity_values.append(float(threat_data['ac']))
         
-        mean_complexity = np.mean(complexity_values)
-        std_complexity = max(0.3, np.std(complexity_values)) if len(complexity_values) > 1 else 0.3
+        mean_complexity, std_complexity = _mean_std(complexity_values, 0.3)
         
         return UncertaintyDistribution(
             mean=mean_complexity,
@@ -144,8 +162,7 @@ class MonteCarloEstimator:
             threat_data = CORE_THREAT_MATRIX.get(vuln_type, DEFAULT_THREAT_VALUES)
             impact_values.append(float(threat_data['impact']))
         
-        mean_impact = np.mean(impact_values)
-        std_impact = max(0.5, np.std(impact_values)) if len(impact_values) > 1 else 0.5
+        mean_impact, std_impact = _mean_std(impact_values, 0.5)
         
         return UncertaintyDistribution(
             mean=mean_impact,
@@ -169,8 +186,7 @@ class MonteCarloEstimator:
             threat_data = CORE_THREAT_MATRIX.get(vuln_type, DEFAULT_THREAT_VALUES)
             severity_values.append(float(threat_data['vs']))
         
-        mean_severity = np.mean(severity_values)
-        std_severity = max(1.0, np.std(severity_values)) if len(severity_values) > 1 else 1.0
+        mean_severity, std_severity = _mean_std(severity_values, 1.0)
         
         return UncertaintyDistribution(
             mean=mean_severity,
@@ -194,8 +210,7 @@ class MonteCarloEstimator:
             threat_data = CORE_THREAT_MATRIX.get(vuln_type, DEFAULT_THREAT_VALUES)
             coupling_values.append(float(threat_data['pc']))
         
-        mean_coupling = np.mean(coupling_values)
-        std_coupling = max(0.3, np.std(coupling_values)) if len(coupling_values) > 1 else 0.3
+        mean_coupling, std_coupling = _mean_std(coupling_values, 0.3)
         
         return UncertaintyDistribution(
             mean=mean_coupling,
@@ -229,21 +244,18 @@ class MonteCarloEstimator:
         alpha = 1 - self.params.confidence_interval
         lower_percentile = (alpha / 2) * 100
         upper_percentile = (1 - alpha / 2) * 100
-        
-        confidence_interval = (
-            np.percentile(samples, lower_percentile),
-            np.percentile(samples, upper_percentile)
-        )
-        
-        # Calculate key percentiles
-        percentiles = {
-            5: np.percentile(samples, 5),
-            25: np.percentile(samples, 25),
-            50: np.percentile(samples, 50),
-            75: np.percentile(samples, 75),
-            95: np.percentile(samples, 95)
-        }
-        
+
+        # Compute all quantiles with one percentile call (single partition
+        # of the samples) instead of seven separate ones
+        ci_low, ci_high, p5, p25, p50, p75, p95 = np.percentile(
+            samples, [lower_percentile, upper_percentile, 5, 25, 50, 75, 95])
+
+        confidence_interval = (ci_low, ci_high)
+
+        # Key percentiles
+        percentiles = {5: p5, 25: p25, 50: p50, 75: p75, 95: p95}
+
+
         return MonteCarloResult(
             mean=mean,
             std_dev=std_dev,
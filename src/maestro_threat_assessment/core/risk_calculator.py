@@ -22,6 +22,11 @@ from .monte_carlo_estimator import MonteCarloEstimator, MonteCarloResult
 @dataclass
 class LayerRiskScore:
     """Risk score for a specific MAESTRO layer with uncertainty"""
+    # One per layer per assessment; fixed schema, so __slots__ avoids a
+    # per-instance __dict__
+    __slots__ = ('layer', 'attack_complexity', 'business_impact',
+                 'vulnerability_severity', 'protocol_coupling',
+                 'vulnerability_count', 'wei_contribution', 'rps_contribution')
     layer: MAESTROLayer
     attack_complexity: MonteCarloResult
     business_impact: MonteCarloResult
@@ -34,6 +39,9 @@ class LayerRiskScore:
 @dataclass
 class RiskAssessmentResult:
     """Complete risk assessment result with Monte Carlo uncertainty"""
+    __slots__ = ('workflow_name', 'total_wei', 'total_rps', 'layer_scores',
+                 'vulnerabilities_by_layer', 'risk_level',
+                 'confidence_interval', 'recommendations')
     workflow_name: str
     total_wei: MonteCarloResult
     total_rps: MonteCarloResult
@@ -53,10 +61,19 @@ class RiskCalculator:
         # Risk thresholds based on combined WEI+RPS score (calibrated)
         self.risk_thresholds = {
             'low': 0.0,        # Low risk: 0 to 0.219
-            'medium': 0.219,   # Medium risk: 0.219 to 0.481  
+            'medium': 0.219,   # Medium risk: 0.219 to 0.481
             'high': 0.481,     # High risk: 0.481 to 0.527
             'critical': 0.527  # Critical risk: 0.527+
         }
+
+        # Precomputed bin edges/names so level lookup is a single
+        # searchsorted call instead of a comparison chain
+        self._risk_level_names = ('low', 'medium', 'high', 'critical')
+        self._risk_level_edges = np.array([
+            self.risk_thresholds['medium'],
+            self.risk_thresholds['high'],
+            self.risk_thresholds['critical']
+        ])
     
     def calculate_risk(self, workflow: ParsedWorkflow, vulnerabilities: List[Dict[str, Any]]) -> RiskAssessmentResult:
         """
@@ -218,22 +235,18 @@ class RiskCalculator:
         """Create a MonteCarloResult from samples array"""
         mean = np.mean(samples)
         std_dev = np.std(samples)
-        
-        # Calculate confidence interval (95% by default)
-        confidence_interval = (
-            np.percentile(samples, 2.5),
-            np.percentile(samples, 97.5)
-        )
-        
-        # Calculate key percentiles
-        percentiles = {
-            5: np.percentile(samples, 5),
-            25: np.percentile(samples, 25),
-            50: np.percentile(samples, 50),
-            75: np.percentile(samples, 75),
-            95: np.percentile(samples, 95)
-        }
-        
+
+        # One percentile call computes all quantiles from a single partition
+        # of the samples instead of seven separate ones
+        ci_low, ci_high, p5, p25, p50, p75, p95 = np.percentile(
+            samples, [2.5, 97.5, 5, 25, 50, 75, 95])
+
+        # Confidence interval (95% by default)
+        confidence_interval = (ci_low, ci_high)
+
+        # Key percentiles
+        percentiles = {5: p5, 25: p25, 50: p50, 75: p75, 95: p95}
+
         return MonteCarloResult(
             mean=mean,
             std_dev=std_dev,
@@ -253,24 +266,17 @@ class RiskCalculator:
         normalized_rps_samples = rps.samples / 30.0
         combined_risk_samples = (wei.samples * 0.7) + (normalized_rps_samples * 0.3)
         
-        # Determine risk level based on mean combined score
+        # Determine risk level based on mean combined score; side='right'
+        # keeps a score equal to a threshold in the higher level
         mean_combined_risk = np.mean(combined_risk_samples)
+        risk_level = self._risk_level_names[
+            np.searchsorted(self._risk_level_edges, mean_combined_risk, side='right')]
         
-        if mean_combined_risk >= self.risk_thresholds['critical']:
-            risk_level = 'critical'
-        elif mean_combined_risk >= self.risk_thresholds['high']:
-            risk_level = 'high'
-        elif mean_combined_risk >= self.risk_thresholds['medium']:
-            risk_level = 'medium'
-        else:
-            risk_level = 'low'
-        
-        # Calculate confidence interval for combined risk
-        confidence_interval = (
-            np.percentile(combined_risk_samples, 2.5),
-            np.percentile(combined_risk_samples, 97.5)
-        )
-        
+        # Calculate confidence interval for combined risk; both bounds
+        # come from one percentile call (a single partition of the samples)
+        ci_low, ci_high = np.percentile(combined_risk_samples, [2.5, 97.5])
+        confidence_interval = (ci_low, ci_high)
+
         return risk_level, confidence_interval
     
     def _generate_recommendations(self, layer_scores: Dict[MAESTROLayer, LayerRiskScore],
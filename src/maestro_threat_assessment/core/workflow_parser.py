@@ -9,6 +9,7 @@ Parses YAML workflow definitions and extracts:
 - Protocol compliance validation
 """
 
+import sys
 import yaml
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
@@ -16,6 +17,22 @@ import re
 
 from .protocol_validator import validate_workflow_protocols, ValidationResult
 
+# Prefer the LibYAML C loader when available; same safe-loading semantics,
+# several times faster on large workflow definitions
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# Compiled once at import time; sensitivity detection runs for every data flow
+_SENSITIVE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'(password|secret|key|token|credential)',
+    r'(social_security|ssn|credit_card|card_number)',
+    r'(personal|private|confidential|classified)',
+    r'(financial|bank|account|payment)',
+    r'(medical|health|patient|diagnosis)'
+))
+
 @dataclass
 class WorkflowStep:
     """Represents a single step in an agentic workflow"""
@@ -53,14 +70,9 @@ class WorkflowParser:
     """YAML workflow parser with security analysis capabilities"""
     
     def __init__(self):
-        self.sensitive_patterns = [
-            r'(password|secret|key|token|credential)',
-            r'(social_security|ssn|credit_card|card_number)',
-            r'(personal|private|confidential|classified)',
-            r'(financial|bank|account|payment)',
-            r'(medical|health|patient|diagnosis)'
-        ]
-        
+        self.sensitive_patterns = _SENSITIVE_PATTERNS
+
+
     def parse_yaml(self, yaml_content: str) -> ParsedWorkflow:
         """
         Parse YAML workflow definition
@@ -72,12 +84,27 @@ class WorkflowParser:
             ParsedWorkflow object with extracted information
         """
         try:
-            workflow_data = yaml.safe_load(yaml_content)
+            workflow_data = yaml.load(yaml_content, Loader=_SafeLoader)
         except yaml.YAMLError as e:
             raise ValueError(f"Invalid YAML format: {e}")
             
         return self._parse_workflow_data(workflow_data)
     
+    def parse_dict(self, workflow_data: Dict[str, Any]) -> ParsedWorkflow:
+        """
+        Parse an already-deserialized workflow definition
+
+        Bypasses YAML parsing entirely for callers that hold the workflow
+        as a Python dict (pre-parsed fixtures, web form payloads, etc.).
+
+        Args:
+            workflow_data: Workflow definition dictionary
+
+        Returns:
+            ParsedWorkflow object with extracted information
+        """
+        return self._parse_workflow_data(workflow_data)
+
     def parse_file(self, filepath: str) -> ParsedWorkflow:
         """
         Parse YAML workflow from file
@@ -119,6 +146,15 @@ class WorkflowParser:
             step_id = step_data.get('id', f"step_{i}")
             agent = step_data.get('agent', 'unknown_agent')
             action = step_data.get('action', 'unknown_action')
+            # Agent and action names repeat heavily across steps and
+            # workflows; interning dedupes the parsed copies and lets
+            # downstream equality checks short-circuit on identity
+            if isinstance(step_id, str):
+                step_id = sys.intern(step_id)
+            if isinstance(agent, str):
+                agent = sys.intern(agent)
+            if isinstance(action, str):
+                action = sys.intern(action)
             params = step_data.get('params', {})
             input_from = step_data.get('input_from')
             dependencies = step_data.get('dependencies', [])
@@ -179,7 +215,7 @@ class WorkflowParser:
         param_str = str(params).lower()
         
         for pattern in self.sensitive_patterns:
-            if re.search(pattern, param_str):
+            if pattern.search(param_str):
                 return "high"
         
         # Check for common sensitive keywords
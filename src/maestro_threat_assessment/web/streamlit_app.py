@@ -217,30 +217,36 @@ if 'custom_parameters' not in st.session_state:
         'exposure_index': dict(MAESTRO_EXPOSURE_INDEX)
     }
 
+# Shared node styling tables, built once instead of per call/per node
+SEVERITY_COLORS = {
+    'critical': '#dc2626',  # Red
+    'high': '#ea580c',      # Orange-red
+    'medium': '#d97706',    # Amber
+    'low': '#059669',       # Green
+    'info': '#0284c7'       # Blue
+}
+
+# Text colors for better contrast (white on every severity background)
+SEVERITY_TEXT_COLORS = {severity: '#ffffff' for severity in SEVERITY_COLORS}
+
+SEVERITY_EMOJI = {
+    'critical': '🔴',
+    'high': '🟠',
+    'medium': '🟡',
+    'low': '🟢',
+    'info': '🔵'
+}
+
 def create_workflow_flowchart(workflow_data: Dict[str, Any], vulnerabilities: List[Dict[str, Any]] = None):
     """Create an interactive flowchart visualization of the workflow"""
-    
+
     nodes = []
     edges = []
-    
-    # Color mapping for vulnerability severity with better contrast
-    severity_colors = {
-        'critical': '#dc2626',  # Red
-        'high': '#ea580c',      # Orange-red  
-        'medium': '#d97706',    # Amber
-        'low': '#059669',       # Green
-        'info': '#0284c7'       # Blue
-    }
-    
-    # Text colors for better contrast
-    text_colors = {
-        'critical': '#ffffff',  # White text on red
-        'high': '#ffffff',      # White text on orange
-        'medium': '#ffffff',    # White text on amber
-        'low': '#ffffff',       # White text on green
-        'info': '#ffffff'       # White text on blue
-    }
-    
+
+    severity_colors = SEVERITY_COLORS
+    text_colors = SEVERITY_TEXT_COLORS
+
+
     # Create vulnerability lookup
     vuln_lookup = {}
     if vulnerabilities:
@@ -284,14 +290,7 @@ def create_workflow_flowchart(workflow_data: Dict[str, Any], vulnerabilities: Li
         ]
         
         if vuln_count > 0:
-            severity_emoji = {
-                'critical': '🔴',
-                'high': '🟠', 
-                'medium': '🟡',
-                'low': '🟢',
-                'info': '🔵'
-            }
-            label_lines.append(f"{severity_emoji.get(highest_severity, '⚠️')} {vuln_count} vuln(s)")
+            label_lines.append(f"{SEVERITY_EMOJI.get(highest_severity, '⚠️')} {vuln_count} vuln(s)")
         
         label = "\n".join(label_lines)
         
@@ -620,13 +619,7 @@ def display_assessment_results(report):
             with st.expander(f"🏗️ {layer} ({len(layer_vulns)} vulnerabilities)"):
                 for _, vuln in layer_vulns.iterrows():
                     severity = vuln['Severity'].lower()
-                    severity_colors = {
-                        'critical': '🔴',
-                        'high': '🟠', 
-                        'medium': '🟡',
-                        'low': '🟢'
-                    }
-                    severity_icon = severity_colors.get(severity, '⚪')
+                    severity_icon = SEVERITY_EMOJI.get(severity, '⚪')
                     
                     st.markdown(f"""
                     **{severity_icon} {vuln['Type'].replace('_', ' ').title()}** ({vuln['Severity']})
@@ -775,15 +768,21 @@ def main():
                 
                 # Run assessment
                 with st.spinner("Running MAESTRO assessment..."):
-                    engine = MAESTROEngine()
-                    
+                    # Keep one engine for the whole session; combined with
+                    # the content-hash memo, re-submitting unchanged YAML
+                    # (a common pattern with Streamlit reruns) is a dict
+                    # lookup instead of a full re-assessment
+                    if 'engine' not in st.session_state:
+                        st.session_state.engine = MAESTROEngine()
+                    engine = st.session_state.engine
+
                     # Apply custom parameters if configured
                     if st.session_state.custom_parameters:
                         # Here you would modify the engine's parameters
                         pass
-                    
-                    report = engine.assess_workflow_from_yaml(yaml_content)
-                    
+
+                    report = engine.assess_workflow_from_yaml_cached(yaml_content)
+
                     st.session_state.assessment_report = report
                 
                 st.success("✅ Assessment completed successfully!")
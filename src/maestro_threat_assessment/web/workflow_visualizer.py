@@ -45,19 +45,22 @@ class WorkflowVisualizer:
     def parse_workflow_structure(self, workflow_yaml: str) -> Dict[str, Any]:
         """Parse YAML workflow using the official MAESTRO WorkflowParser for consistency"""
         try:
-            # Use the official parser to ensure consistency with CLI
-            parsed_workflow: ParsedWorkflow = self.workflow_parser.parse_yaml(workflow_yaml)
-            
+            # Deserialize the YAML once and feed the dict to the official
+            # parser for consistency with the CLI; the previous version
+            # ran the YAML scanner twice over the same string (once for
+            # the parser, once for the agent-definition lookup below)
+            workflow_data = yaml.safe_load(workflow_yaml)
+            parsed_workflow: ParsedWorkflow = self.workflow_parser.parse_dict(workflow_data)
+
             # Convert ParsedWorkflow to the structure needed for visualization
             # while maintaining compatibility with existing visualization code
-            
+
             # Extract agents from workflow steps and build agent info
             agents = {}
-            
-            # Parse the original YAML to get agent tool information
+
+            # Read agent tool information from the already-parsed dict
             # since ParsedWorkflow focuses on steps, not agent definitions
             try:
-                workflow_data = yaml.safe_load(workflow_yaml)
                 workflow_section = workflow_data.get('workflow', {})
                 
                 # Get agent definitions if they exist
@@ -10,6 +10,7 @@
 import os
 import json
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
 # Add src to path
 import sys
@@ -40,11 +41,13 @@ def summarize_workflow(filepath: str):
     }
 
 def main():
-    summaries = []
-    for fname in os.listdir(EXAMPLES_DIR):
-        if fname.endswith('.yaml') or fname.endswith('.yml'):
-            path = os.path.join(EXAMPLES_DIR, fname)
-            summaries.append(summarize_workflow(path))
+    paths = [os.path.join(EXAMPLES_DIR, fname)
+             for fname in os.listdir(EXAMPLES_DIR)
+             if fname.endswith('.yaml') or fname.endswith('.yml')]
+    # Each assessment is an independent CPU-bound task, so spread them
+    # across cores; workers re-import this module and get their own engine
+    with ProcessPoolExecutor() as executor:
+        summaries = list(executor.map(summarize_workflow, paths))
     # Print overview
     print("=== Threat Assignment Overview ===")
     for s in summaries: